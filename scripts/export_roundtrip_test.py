@@ -10,6 +10,7 @@ Usage (MCP):
 """
 
 import json
+import sys
 
 # Test configuration
 TEST_OBJ = "ExportTest"
@@ -77,16 +78,29 @@ print(f"    Link count matches: {exported_link_count}")
 
 # Step 4: Verify settings were captured
 print("\n[4] Verifying settings...")
+lines: list[str] = []
+
+
+def _flush_lines():
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
 for node_id, original_settings in original_graph["node_settings"].items():
     exported_settings = exported_graph["node_settings"].get(node_id, {})
     for key, original_value in original_settings.items():
         exported_value = exported_settings.get(key)
         # Allow some float tolerance
         if isinstance(original_value, float) and isinstance(exported_value, float):
-            assert abs(original_value - exported_value) < 0.001, f"{node_id}.{key}: {original_value} vs {exported_value}"
+            matches = abs(original_value - exported_value) < 0.001
         else:
-            assert exported_value == original_value, f"{node_id}.{key}: {original_value} vs {exported_value}"
-        print(f"    {node_id}.{key}: {original_value} == {exported_value}")
+            matches = exported_value == original_value
+        if not matches:
+            _flush_lines()  # keep the keys that already passed for debugging
+        assert matches, f"{node_id}.{key}: {original_value} vs {exported_value}"
+        lines.append(f"    {node_id}.{key}: {original_value} == {exported_value}")
+_flush_lines()
 
 # Step 5: Rebuild from exported JSON (on a new object)
 print("\n[5] Rebuilding from exported JSON...")
@@ -24,19 +24,27 @@ import json
 import re
 from pathlib import Path
 
-ANCHOR_PATTERN = re.compile(r"\.\. _bpy\.types\.([A-Za-z0-9_]+):")
-HEADING_PATTERN = re.compile(r"(?m)^([A-Za-z0-9 ].+)\n([=*~`^\"'\-]{3,})\n")
+ANCHOR_PATTERN = re.compile(r"\.\. _bpy\.types\.([A-Za-z0-9_]+):", re.ASCII)
+HEADING_PATTERN = re.compile(r"(?m)^([A-Za-z0-9 ].+)\n([=*~`^\"'\-]{3,})\n", re.ASCII)
 SECTION_SKIP = {"GeometryNode", "GeometryNodeTree", "GeometryNodeGroup"}
-ADMONITION_PATTERN = re.compile(r"(?ms)\.{2} (note|tip|warning|caution)::\n\s+(.+?)(?:\n\n|$)")
+ADMONITION_PATTERN = re.compile(r"(?ms)\.{2} (note|tip|warning|caution)::\n\s+(.+?)(?:\n\n|$)", re.ASCII)
 IDENT_PREFIXES = ("GeometryNode", "ShaderNode", "FunctionNode")
-ROLE_WITH_LINK = re.compile(r":([A-Za-z0-9_-]+):`([^`<]+)(?: <([^`>]+)>)?`")
-ROLE_SIMPLE = re.compile(r":([A-Za-z0-9_-]+):`([^`]*)`")
+ROLE_WITH_LINK = re.compile(r":([A-Za-z0-9_-]+):`([^`<]+)(?: <([^`>]+)>)?`", re.ASCII)
+ROLE_SIMPLE = re.compile(r":([A-Za-z0-9_-]+):`([^`]*)`", re.ASCII)
+BULLET_PARAM_PATTERN = re.compile(r"-\s+\*\*(.+?)\*\*\s+--\s+(.*)", re.ASCII)
+STRONG_PATTERN = re.compile(r"\*\*(.+?)\*\*", re.ASCII)
+BARE_ROLE_PATTERN = re.compile(r":([A-Za-z0-9 _-]+):", re.ASCII)
 
 
 def extract_metadata(manual_root: Path) -> dict[str, dict[str, object]]:
     data: dict[str, dict[str, object]] = {}
     for path in manual_root.rglob("*.rst"):
-        text = path.read_text(encoding="utf-8", errors="ignore")
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        # Most manual pages carry no node anchors; skip them before decoding.
+        if b".. _bpy.types." not in raw:
+            continue
+        text = raw.decode("utf-8", "ignore")
         for match in ANCHOR_PATTERN.finditer(text):
             identifier = match.group(1)
             if not identifier.startswith(IDENT_PREFIXES):
@@ -174,7 +182,7 @@ def _parse_bullet_parameters(text: str) -> list[dict[str, str]]:
     params: list[dict[str, str]] = []
     for line in text.splitlines():
         stripped = line.strip()
-        match = re.match(r"-\s+\*\*(.+?)\*\*\s+--\s+(.*)", stripped)
+        match = BULLET_PARAM_PATTERN.match(stripped)
         if match:
             name = _replace_roles(match.group(1).strip())
             desc = _replace_roles(match.group(2).strip())
@@ -188,8 +196,8 @@ def _replace_roles(text: str) -> str:
 
     text = ROLE_WITH_LINK.sub(repl_link, text)
     text = ROLE_SIMPLE.sub(lambda m: m.group(2).strip(), text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r":([A-Za-z0-9 _-]+):", r"\1", text)
+    text = STRONG_PATTERN.sub(r"\1", text)
+    text = BARE_ROLE_PATTERN.sub(r"\1", text)
     return text
 
 
@@ -5,7 +5,11 @@ This intentionally wires a field output into a non-field input and
 expects the preflight/build to fail.
 """
 
+import hashlib
+import marshal
 import os
+import sys
+import types
 from pathlib import Path
 
 REPO_ROOT = Path(os.environ.get("GN_MCP_BASE_PATH", "/Users/alexanderporter/Documents/_DEV/Geo Nodes MCP"))
@@ -16,8 +20,43 @@ if "GN_MCP_SOCKET_COMPAT_PATH" not in os.environ:
 if "GN_MCP_CATALOGUE_PATH" not in os.environ:
     os.environ["GN_MCP_CATALOGUE_PATH"] = str(REPO_ROOT / "reference" / "geometry_nodes_complete_4_4.json")
 
-with open(TOOLKIT_PATH, "r", encoding="utf-8") as fh:
-    code = compile(fh.read(), str(TOOLKIT_PATH), "exec")
+# Reuse compiled toolkit bytecode across runs. The cache lives in a per-user
+# directory that only its owner can write, and the file name covers interpreter
+# tag, resolved source path and mtime/size.
+_toolkit_stat = TOOLKIT_PATH.stat()
+_toolkit_cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gn_mcp_toolkit"
+_toolkit_path_hash = hashlib.sha1(str(TOOLKIT_PATH.resolve()).encode("utf-8")).hexdigest()[:16]
+_toolkit_cache = _toolkit_cache_dir / (
+    f"toolkit_{sys.implementation.cache_tag}_{_toolkit_path_hash}"
+    f"_{_toolkit_stat.st_mtime_ns}_{_toolkit_stat.st_size}.pyc"
+)
+try:
+    _toolkit_cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _toolkit_cache_dir_stat = _toolkit_cache_dir.stat()
+    _toolkit_cache_ok = not hasattr(os, "getuid") or (
+        _toolkit_cache_dir_stat.st_uid == os.getuid()
+        and not _toolkit_cache_dir_stat.st_mode & 0o022
+    )
+except OSError:
+    _toolkit_cache_ok = False
+code = None
+if _toolkit_cache_ok and _toolkit_cache.exists():
+    try:
+        code = marshal.loads(_toolkit_cache.read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        code = None  # truncated or corrupt cache: recompile below
+    if not isinstance(code, types.CodeType):
+        code = None
+if code is None:
+    with open(TOOLKIT_PATH, "r", encoding="utf-8") as fh:
+        code = compile(fh.read(), str(TOOLKIT_PATH), "exec")
+    if _toolkit_cache_ok:
+        try:
+            _toolkit_cache_tmp = _toolkit_cache.with_suffix(f".{os.getpid()}.tmp")
+            _toolkit_cache_tmp.write_bytes(marshal.dumps(code))
+            os.replace(_toolkit_cache_tmp, _toolkit_cache)
+        except OSError:
+            pass
 exec(code, globals())
 
 OBJECT_NAME = "MCP_Field_Mismatch_Object"
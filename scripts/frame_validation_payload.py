@@ -4,18 +4,33 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import contextlib
 import copy
+import functools
 import json
 import os
+import re
+import shlex
 import subprocess
 import sys
 import textwrap
+import threading
 from datetime import datetime
 from pathlib import Path
 from string import Template
-from typing import List, Tuple, Callable
+from typing import IO, List, TextIO, Tuple, Callable
+
+try:
+    import orjson  # optional: faster parsing for large graph specs
+except ImportError:
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+TOOLKIT_PATH = os.fspath(REPO_ROOT / "toolkit.py")
+SOCKET_COMPAT_PATH = os.fspath(REPO_ROOT / "reference" / "socket_compat.csv")
+CATALOGUE_PATH = os.fspath(REPO_ROOT / "reference" / "geometry_nodes_complete_5_0.json")
+ARCHIVE_DIR = os.fspath(REPO_ROOT / "_archive")
 COLLECTION = "MCP_Frame_Test"
 OBJECT_NAME = "MCP_Frame_Object"
 MODIFIER_NAME = "MCP_Frame_Mod"
@@ -70,8 +85,13 @@ GRAPH_JSON = copy.deepcopy(DEFAULT_GRAPH_JSON)
 FRAME_SPECS = copy.deepcopy(DEFAULT_FRAME_SPECS)
 NODE_SETTINGS = copy.deepcopy(DEFAULT_NODE_SETTINGS)
 
+@functools.lru_cache(maxsize=1)
 def _get_session_notes_path() -> Path:
-    """Get session notes path from env var or default to today's date."""
+    """Get session notes path from env var or default to today's date.
+
+    Resolved once per process: later changes to ``MCP_SESSION_NOTES`` or a
+    date rollover do not affect an already-running driver.
+    """
     env_path = os.environ.get("MCP_SESSION_NOTES")
     if env_path:
         return Path(env_path)
@@ -79,10 +99,27 @@ def _get_session_notes_path() -> Path:
     return REPO_ROOT / "_archive" / f"session_notes_{today}.md"
 
 DEFAULT_ALIAS = "blender"
+# Text prefix execute_blender_code returns when the code raised in Blender.
+MCP_ERROR_PREFIX = "Error executing code"
+
+
+def _read_json(path: Path):
+    """Parse a JSON file straight from bytes, using orjson when available."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(value) -> str:
+    """Serialize ``value`` compactly, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"))
 
 
 def _load_graph_spec(path: Path) -> Tuple[dict, List[dict] | None]:
-    data = json.loads(path.read_text())
+    data = _read_json(path)
     if not isinstance(data, dict):
         raise SystemExit(f"Graph spec at {path} must be a JSON object")
     graph_json = data.get("graph_json", data)
@@ -99,123 +136,430 @@ def configure_payload(
     *,
     frame_specs: List[dict] | None = None,
     node_settings: dict | None = None,
+    copy_inputs: bool = False,
 ) -> None:
-    """Update module-level payload data for subsequent MCP calls."""
+    """Update module-level payload data for subsequent MCP calls.
+
+    The inputs are stored by reference; callers must not mutate them
+    afterwards unless ``copy_inputs=True`` is passed.
+    """
 
     global GRAPH_JSON, FRAME_SPECS, NODE_SETTINGS
-    GRAPH_JSON = copy.deepcopy(graph_json)
-    FRAME_SPECS = copy.deepcopy(
-        frame_specs if frame_specs is not None else DEFAULT_FRAME_SPECS
-    )
-    NODE_SETTINGS = copy.deepcopy(
-        node_settings if node_settings is not None else DEFAULT_NODE_SETTINGS
-    )
+    if frame_specs is None:
+        frame_specs = DEFAULT_FRAME_SPECS
+    if node_settings is None:
+        node_settings = DEFAULT_NODE_SETTINGS
+    if copy_inputs:
+        graph_json, frame_specs, node_settings = copy.deepcopy(
+            (graph_json, frame_specs, node_settings)
+        )
+    GRAPH_JSON = graph_json
+    FRAME_SPECS = frame_specs
+    NODE_SETTINGS = node_settings
+
+
+def _pump_stream(source: IO[bytes], sink: TextIO) -> None:
+    # Pass bytes straight through; os.read returns whatever is available, so
+    # output still streams live without a decode/encode round trip. Sinks
+    # without a binary buffer (StringIO, captured streams) get decoded text.
+    fd = source.fileno()
+    out = getattr(sink, "buffer", None)
+    # Incremental so a multi-byte character split across reads still decodes.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace") if out is None else None
+    while chunk := os.read(fd, 65536):
+        if out is not None:
+            out.write(chunk)
+            out.flush()
+        else:
+            sink.write(decoder.decode(chunk))
+            sink.flush()
+    if decoder is not None:
+        sink.write(decoder.decode(b"", final=True))
+    source.close()
+
+
+class MCPStdioSession:
+    """Minimal MCP client that keeps one stdio server process open.
+
+    Speaks newline-delimited JSON-RPC (the MCP stdio transport) so every step
+    reuses the same server and Blender connection instead of spawning a new
+    ``uvx blender-mcp call`` per step. The server's stderr is inherited so
+    its diagnostics still appear live.
+    """
 
+    PROTOCOL_VERSION = "2024-11-05"
+
+    def __init__(self, command: List[str]):
+        self.command = command
+        self.proc: subprocess.Popen | None = None
+        self._next_id = 0
+
+    def __enter__(self) -> "MCPStdioSession":
+        print(f"[mcp] starting persistent session: {' '.join(self.command)}", flush=True)
+        self.proc = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        try:
+            self._request(
+                "initialize",
+                {
+                    "protocolVersion": self.PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "frame_validation_payload", "version": "1"},
+                },
+            )
+            self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except BaseException:
+            # __exit__ does not run when __enter__ raises; don't leak the server.
+            self.proc.kill()
+            self._close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass  # server already gone
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+        self._close()
+
+    def _close(self) -> None:
+        self.proc.wait()
+        for pipe in (self.proc.stdin, self.proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        self.proc = None
+
+    def call_tool(self, name: str, arguments: dict) -> dict:
+        return self._request("tools/call", {"name": name, "arguments": arguments})
+
+    def _send(self, message: dict) -> None:
+        self.proc.stdin.write(_dumps_json(message) + "\n")
+        self.proc.stdin.flush()
+
+    def _request(self, method: str, params: dict) -> dict:
+        self._next_id += 1
+        request_id = self._next_id
+        self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        for line in self.proc.stdout:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # stray non-JSON output from the server
+            if not isinstance(message, dict):
+                continue
+            if message.get("id") != request_id:
+                continue  # server notifications / log messages
+            if "error" in message:
+                raise SystemExit(f"MCP {method} failed: {message['error']}")
+            return message.get("result", {})
+        raise SystemExit(f"MCP server exited during {method} (exit code {self.proc.poll()})")
+
+
+def run_mcp(code: str, label: str, alias: str, session: MCPStdioSession | None = None) -> None:
+    if session is not None:
+        print(f"\n[step:{label}] running execute_blender_code via persistent session ...", flush=True)
+        result = session.call_tool(
+            "execute_blender_code",
+            {"code": code, "user_prompt": f"Frame validation step: {label}"},
+        )
+        for item in result.get("content", []):
+            if item.get("type") == "text":
+                sys.stdout.write(item["text"].rstrip("\n") + "\n")
+        sys.stdout.flush()
+        # blender-mcp reports exceptions as text content without isError.
+        if result.get("isError") or any(
+            item.get("type") == "text" and item.get("text", "").startswith(MCP_ERROR_PREFIX)
+            for item in result.get("content", [])
+        ):
+            raise SystemExit(f"Step '{label}' failed inside Blender")
+        return
 
-def run_mcp(code: str, label: str, alias: str) -> None:
-    params = json.dumps({"code": code, "user_prompt": f"Frame validation step: {label}"})
+    params = _dumps_json({"code": code, "user_prompt": f"Frame validation step: {label}"})
     cmd = ["uvx", "blender-mcp", "call", alias, "execute_blender_code", "--params", params]
     print(f"\n[step:{label}] running {' '.join(cmd[:-2])} ...", flush=True)
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    sys.stdout.write(proc.stdout)
-    sys.stderr.write(proc.stderr)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
+    # Tee both pipes as output arrives so long Blender steps show progress
+    # without buffering the whole output in memory.
+    readers = [
+        threading.Thread(target=_pump_stream, args=(proc.stdout, sys.stdout), daemon=True),
+        threading.Thread(target=_pump_stream, args=(proc.stderr, sys.stderr), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    proc.wait()
+    for reader in readers:
+        reader.join()
     if proc.returncode != 0:
         raise SystemExit(f"Step '{label}' failed with exit code {proc.returncode}")
 
 
+@functools.lru_cache(maxsize=1)
 def common_preamble() -> str:
     return textwrap.dedent(
         f"""
-        import json, os, shutil
+        import hashlib, json, marshal, os, shutil, sys, types
         from datetime import datetime
         from pathlib import Path
 
-        REPO_ROOT = Path({str(REPO_ROOT)!r})
-        TOOLKIT_PATH = Path(os.environ.get("GN_MCP_TOOLKIT_PATH", REPO_ROOT / "toolkit.py"))
-        os.environ.setdefault("GN_MCP_SOCKET_COMPAT_PATH", str(REPO_ROOT / "reference" / "socket_compat.csv"))
-        os.environ.setdefault("GN_MCP_CATALOGUE_PATH", str(REPO_ROOT / "reference" / "geometry_nodes_complete_5_0.json"))
-
-        with open(TOOLKIT_PATH, "r", encoding="utf-8") as fh:
-            code = compile(fh.read(), str(TOOLKIT_PATH), "exec")
-        exec(code, globals())
+        try:
+            import orjson
+            _json_loads = orjson.loads
+        except ImportError:
+            _json_loads = json.loads
+
+        REPO_ROOT = Path({os.fspath(REPO_ROOT)!r})
+        TOOLKIT_PATH = Path(os.environ.get("GN_MCP_TOOLKIT_PATH", {TOOLKIT_PATH!r}))
+        os.environ.setdefault("GN_MCP_SOCKET_COMPAT_PATH", {SOCKET_COMPAT_PATH!r})
+        os.environ.setdefault("GN_MCP_CATALOGUE_PATH", {CATALOGUE_PATH!r})
+
+        # execute_blender_code runs each call in a fresh namespace, so remember the
+        # loaded toolkit in a registry module that outlives the call. The key covers
+        # the source file and reference paths, so edits or new paths force a reload.
+        _toolkit_stat = TOOLKIT_PATH.stat()
+        _toolkit_key = (
+            str(TOOLKIT_PATH), _toolkit_stat.st_mtime_ns, _toolkit_stat.st_size,
+            os.environ["GN_MCP_SOCKET_COMPAT_PATH"], os.environ["GN_MCP_CATALOGUE_PATH"],
+        )
+        _toolkit_registry = sys.modules.get("_gn_mcp_toolkit_registry")
+        if _toolkit_registry is None:
+            _toolkit_registry = sys.modules["_gn_mcp_toolkit_registry"] = types.ModuleType("_gn_mcp_toolkit_registry")
+            _toolkit_registry.loaded = {{}}
+        if _toolkit_key in _toolkit_registry.loaded:
+            globals().update(_toolkit_registry.loaded[_toolkit_key])
+        else:
+            # Reuse compiled toolkit bytecode across runs. The cache lives in a
+            # per-user directory that only its owner can write, and the file name
+            # covers interpreter tag, resolved source path and mtime/size.
+            _toolkit_cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gn_mcp_toolkit"
+            _toolkit_path_hash = hashlib.sha1(str(TOOLKIT_PATH.resolve()).encode("utf-8")).hexdigest()[:16]
+            _toolkit_cache = _toolkit_cache_dir / (
+                f"toolkit_{{sys.implementation.cache_tag}}_{{_toolkit_path_hash}}"
+                f"_{{_toolkit_stat.st_mtime_ns}}_{{_toolkit_stat.st_size}}.pyc"
+            )
+            try:
+                _toolkit_cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                _toolkit_cache_dir_stat = _toolkit_cache_dir.stat()
+                _toolkit_cache_ok = not hasattr(os, "getuid") or (
+                    _toolkit_cache_dir_stat.st_uid == os.getuid()
+                    and not _toolkit_cache_dir_stat.st_mode & 0o022
+                )
+            except OSError:
+                _toolkit_cache_ok = False
+            code = None
+            if _toolkit_cache_ok and _toolkit_cache.exists():
+                try:
+                    code = marshal.loads(_toolkit_cache.read_bytes())
+                except (OSError, ValueError, EOFError, TypeError):
+                    code = None  # truncated or corrupt cache: recompile below
+                if not isinstance(code, types.CodeType):
+                    code = None
+            if code is None:
+                with open(TOOLKIT_PATH, "r", encoding="utf-8") as fh:
+                    code = compile(fh.read(), str(TOOLKIT_PATH), "exec")
+                if _toolkit_cache_ok:
+                    try:
+                        _toolkit_cache_tmp = _toolkit_cache.with_suffix(f".{{os.getpid()}}.tmp")
+                        _toolkit_cache_tmp.write_bytes(marshal.dumps(code))
+                        os.replace(_toolkit_cache_tmp, _toolkit_cache)
+                    except OSError:
+                        pass
+            _toolkit_before = dict(globals())
+            exec(code, globals())
+            # Remember only what the toolkit defined, so a later hit never puts
+            # back this run's preamble globals (REPO_ROOT, paths) in another run.
+            _toolkit_missing = object()
+            _toolkit_registry.loaded = {{_toolkit_key: {{
+                name: value
+                for name, value in globals().items()
+                if _toolkit_before.get(name, _toolkit_missing) is not value
+                and name not in ("_toolkit_before", "_toolkit_missing")
+            }}}}
+            del _toolkit_before, _toolkit_missing
         """
     )
 
 
-def dedent_template(template: str, **subs: str) -> str:
-    dedented = textwrap.dedent(template)
-    return textwrap.dedent(Template(dedented).substitute(**subs))
+def json_assignment(name: str, value: object) -> str:
+    """Return payload source that rebuilds ``value`` from a compact JSON string.
+
+    Decoding a JSON string literal in Blender is much cheaper than having the
+    Python compiler parse a large ``repr()`` dict literal. The value is
+    serialized on every call so in-place edits are always picked up.
+
+    Values JSON would change or reject (tuples, non-string keys, NaN or
+    infinities, sets) fall back to a ``repr()`` literal so Blender sees
+    exactly what the driver holds.
+    """
+    try:
+        blob = json.dumps(value, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError):
+        blob = None
+    if blob is not None and json.loads(blob) == value:
+        return f"\n{name} = _json_loads({blob!r})\n"
+    return f"\nfrom math import inf, nan\n{name} = {value!r}\n"
+
+
+def combined_code(step_builders: List[Tuple[str, Callable[[bool], str]]]) -> str:
+    """Return a single payload that loads the toolkit once and runs every step.
+
+    Each step body is wrapped so a ``SystemExit`` reports which step aborted
+    before propagating, preserving the per-step failure semantics of
+    separate MCP calls.
+    """
+    parts = [common_preamble()]
+    for label, builder in step_builders:
+        body = builder(include_preamble=False).strip("\n")
+        parts.append(
+            f"# === Step: {label} ===\n"
+            f"print({f'[step:{label}] running'!r}, flush=True)\n"
+            "try:\n"
+            + textwrap.indent(body, "    ")
+            + "\nexcept SystemExit as exc:\n"
+            + f"    print({f'[step:{label}] FAILED:'!r}, exc, flush=True)\n"
+            + "    raise\n"
+        )
+    return "\n\n".join(parts)
+
+
+# Custom property on the node group holding the JSON id -> node name index
+# written by the build step.
+NODE_INDEX_PROP = "gn_mcp_node_index"
+
+# Resolves ``node_map`` (JSON id -> node) from the build step's index, falling
+# back to a full scan if the index is missing or any entry no longer matches.
+NODE_MAP_CODE = textwrap.dedent(
+    f"""
+    id_prop = _NODE_ID_PROP
+    nodes = mod.node_group.nodes
+    node_map = {{}}
+    for node_id, node_name in (mod.node_group.get({NODE_INDEX_PROP!r}) or {{}}).items():
+        node = nodes.get(node_name)
+        if node is None or node.get(id_prop, node_id) != node_id:
+            node_map = {{}}
+            break
+        node_map[node_id] = node
+    if not node_map:
+        node_map = {{node_id: node for node in nodes if (node_id := node.get(id_prop))}}
+    """
+).strip("\n")
+
+
+_BUILD_TMPL = Template(textwrap.dedent(
+    """
+    import bpy
+    print("[build] Clearing collection and building graph...", flush=True)
+    clear_collection($collection)
+    build_result = build_graph_from_json(
+        $object_name,
+        $modifier_name,
+        GRAPH_JSON,
+        collection=$collection,
+    )
+    build_summary = {
+        "success": build_result.get("success"),
+        "node_group": build_result.get("node_group_name"),
+        "nodes": len(build_result.get("nodes", {})),
+        "errors": len(build_result.get("errors", [])),
+    }
+    print(json.dumps(build_summary))
+    if not build_result.get("success"):
+        # Node entries are bpy objects, so stringify anything non-JSON.
+        print(json.dumps(build_result, indent=2, default=str))
+        raise SystemExit("build failed")
+    # Record JSON id -> node name on the node group so later steps can
+    # resolve nodes without scanning every node's custom properties. Group
+    # input/output placeholders are left out, as the fallback scan skips them.
+    bpy.data.node_groups[build_result["node_group_name"]][$index_prop] = {
+        node_id: node.name
+        for node_id, node in build_result["nodes"].items()
+        if node_id not in SPECIAL_NODE_TYPES
+    }
+    """
+))
 
 
 def build_code(include_preamble: bool = True) -> str:
     code = common_preamble() if include_preamble else ""
-    code += f"\nGRAPH_JSON = {repr(GRAPH_JSON)}\n"
-    code += dedent_template(
-        """
-        print("[build] Clearing collection and building graph...", flush=True)
-        clear_collection($collection)
-        build_result = build_graph_from_json(
-            $object_name,
-            $modifier_name,
-            GRAPH_JSON,
-            collection=$collection,
-        )
-        print(json.dumps(build_result, indent=2))
-        if not build_result.get("success"):
-            raise SystemExit("build failed")
-        """,
+    code += json_assignment("GRAPH_JSON", GRAPH_JSON)
+    code += _BUILD_TMPL.substitute(
         collection=repr(COLLECTION),
         object_name=repr(OBJECT_NAME),
         modifier_name=repr(MODIFIER_NAME),
+        index_prop=repr(NODE_INDEX_PROP),
     )
     return code
 
 
+_NODE_SETTINGS_TMPL = Template(textwrap.dedent(
+    """
+    import bpy
+    print("[node-settings] Applying post-build node parameters...", flush=True)
+    obj = bpy.data.objects.get($object_name)
+    mod = obj.modifiers.get($modifier_name) if obj else None
+    if not (obj and mod and mod.node_group):
+        raise SystemExit("Missing object or node group for node-settings step")
+    $node_map_code
+    for node_id, inputs in NODE_SETTINGS.items():
+        node = node_map.get(node_id)
+        if not node:
+            print(f"[node-settings] Skipping unknown node {node_id}")
+            continue
+        failures = set_node_inputs(node, inputs)
+        if failures:
+            details = "; ".join(f"{node_id}.{name}: {err}" for name, err in failures.items())
+            raise SystemExit(f"Failed to apply node settings: {details}")
+    print("[node-settings] Done", flush=True)
+    """
+))
+
+
 def node_settings_code(include_preamble: bool = True) -> str:
+    if not NODE_SETTINGS:
+        # Nothing to apply: skip the toolkit load and the node scan entirely.
+        return '\nprint("[node-settings] No node settings to apply", flush=True)\n'
     code = common_preamble() if include_preamble else ""
-    code += f"\nNODE_SETTINGS = {repr(NODE_SETTINGS)}\n"
-    code += dedent_template(
-        """
-        import bpy
-        print("[node-settings] Applying post-build node parameters...", flush=True)
-        obj = bpy.data.objects.get($object_name)
-        mod = obj.modifiers.get($modifier_name) if obj else None
-        if not (obj and mod and mod.node_group):
-            raise SystemExit("Missing object or node group for node-settings step")
-        node_map = {}
-        for node in mod.node_group.nodes:
-            node_id = node.get(_NODE_ID_PROP) if hasattr(node, "get") else None
-            if node_id:
-                node_map[node_id] = node
-        for node_id, inputs in NODE_SETTINGS.items():
-            node = node_map.get(node_id)
-            if not node:
-                print(f"[node-settings] Skipping unknown node {node_id}")
-                continue
-            for socket_name, value in inputs.items():
-                set_node_input(node, socket_name, value)
-        print("[node-settings] Done", flush=True)
-        """,
+    code += json_assignment("NODE_SETTINGS", NODE_SETTINGS)
+    code += _NODE_SETTINGS_TMPL.substitute(
         object_name=repr(OBJECT_NAME),
         modifier_name=repr(MODIFIER_NAME),
+        node_map_code=NODE_MAP_CODE,
     )
     return code
 
 
+_VALIDATION_TMPL = Template(textwrap.dedent(
+    """
+    import bpy
+    print("[validation] Running full_geo_nodes_validation...", flush=True)
+    obj = bpy.data.objects.get($object_name)
+    if obj:
+        obj.location.z = $z_offset
+    validation = full_geo_nodes_validation($object_name, $modifier_name, capture_screenshot=False)
+    print_validation_report(validation)
+    if validation.get("status") != "VALID":
+        raise SystemExit("Validation failed; adjust node settings or offsets")
+    """
+))
+
+
 def validation_code(include_preamble: bool = True) -> str:
     code = common_preamble() if include_preamble else ""
-    code += dedent_template(
-        """
-        import bpy
-        print("[validation] Running full_geo_nodes_validation...", flush=True)
-        obj = bpy.data.objects.get($object_name)
-        if obj:
-            obj.location.z = $z_offset
-        validation = full_geo_nodes_validation($object_name, $modifier_name, capture_screenshot=False)
-        print_validation_report(validation)
-        if validation.get("status") != "VALID":
-            raise SystemExit("Validation failed; adjust node settings or offsets")
-        """,
+    code += _VALIDATION_TMPL.substitute(
         object_name=repr(OBJECT_NAME),
         modifier_name=repr(MODIFIER_NAME),
         z_offset=OBJECT_Z_OFFSET,
@@ -223,91 +567,110 @@ def validation_code(include_preamble: bool = True) -> str:
     return code
 
 
+_FRAMES_TMPL = Template(textwrap.dedent(
+    """
+    import bpy
+    print("[frames] Applying frame specs...", flush=True)
+    obj = bpy.data.objects.get($object_name)
+    mod = obj.modifiers.get($modifier_name) if obj else None
+    if not (obj and mod and mod.node_group):
+        raise SystemExit("Missing object/modifier for frames step")
+    $node_map_code
+    errors = []
+    _apply_frames(mod.node_group, node_map, FRAME_SPECS, errors)
+    if errors:
+        raise SystemExit("Frame errors: " + "; ".join(errors))
+    print("[frames] Applied", len(FRAME_SPECS), "frames", flush=True)
+    """
+))
+
+
 def frames_code(include_preamble: bool = True) -> str:
     code = common_preamble() if include_preamble else ""
-    code += f"\nFRAME_SPECS = {repr(FRAME_SPECS)}\n"
-    code += dedent_template(
-        """
-        import bpy
-        print("[frames] Applying frame specs...", flush=True)
-        obj = bpy.data.objects.get($object_name)
-        mod = obj.modifiers.get($modifier_name) if obj else None
-        if not (obj and mod and mod.node_group):
-            raise SystemExit("Missing object/modifier for frames step")
-        node_map = {}
-        for node in mod.node_group.nodes:
-            node_id = node.get(_NODE_ID_PROP) if hasattr(node, "get") else None
-            if node_id:
-                node_map[node_id] = node
-        errors = []
-        _apply_frames(mod.node_group, node_map, FRAME_SPECS, errors)
-        if errors:
-            raise SystemExit("Frame errors: " + "; ".join(errors))
-        print("[frames] Applied", len(FRAME_SPECS), "frames", flush=True)
-        """,
+    code += json_assignment("FRAME_SPECS", FRAME_SPECS)
+    code += _FRAMES_TMPL.substitute(
         object_name=repr(OBJECT_NAME),
         modifier_name=repr(MODIFIER_NAME),
+        node_map_code=NODE_MAP_CODE,
     )
     return code
 
 
-def export_code(screenshot_rel: str, include_preamble: bool = True) -> str:
-    screenshot_abs = (REPO_ROOT / "_archive" / screenshot_rel).as_posix()
-    code = common_preamble() if include_preamble else ""
-    template = Template(
-        """
+_EXPORT_TMPL = Template(
+    """
 import bpy
 print("[export] Dumping frames and capturing screenshot...", flush=True)
 export_data = export_modifier_to_json($object_name, $modifier_name)
 frames = export_data.get("graph_json", {}).get("frames", [])
-print(json.dumps(frames, indent=2))
+print(json.dumps(frames, separators=(",", ":")))
 switch_to_mcp_workspace()
 frame_object_in_viewport($object_name, use_local_view=True)
 
+# Open the log once (line-buffered) rather than reopening it per message, and
+# close it before the step returns: Blender's interpreter outlives the call.
+_log_path = REPO_ROOT / "_archive" / "frame_validation_payload.log"
+_log_path.parent.mkdir(parents=True, exist_ok=True)
+_log_fh = open(_log_path, "a", encoding="utf-8", buffering=1)
+
 def _payload_log(message: str):
-    log_path = REPO_ROOT / "_archive" / "frame_validation_payload.log"
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, "a", encoding="utf-8") as log_fh:
-        log_fh.write(f"{datetime.now().isoformat()} {message}\\n")
-
-# Screenshot capture is flaky when Blender is left in fullscreen; capturing twice is safer
-capture_path = capture_node_graph($object_name, $modifier_name)
-_payload_log(f"[export] capture_node_graph returned: {capture_path}")
-print(f"[export] capture_node_graph returned: {capture_path}")
-target = Path($screenshot_abs)
-
-def _copy_candidate(candidate_path, label):
-    candidate = Path(candidate_path) if candidate_path else None
-    if candidate and candidate.exists():
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(candidate, target)
-        msg = f"[export] Screenshot saved to {target} via {label}"
-        print(msg)
-        _payload_log(msg)
-        return True
-    return False
-
-if not _copy_candidate(capture_path, "primary"):
-    warn = "[export] Screenshot missing; retrying once..."
-    print(warn)
-    _payload_log(warn)
+    _log_fh.write(f"{datetime.now().isoformat()} {message}\\n")
+
+try:
+    # Force one synchronous redraw after the workspace switch so the first capture
+    # sees a settled UI; the retry below only runs if that capture fails.
+    try:
+        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+    except Exception as exc:
+        _payload_log(f"[export] redraw_timer unavailable: {exc}")
     capture_path = capture_node_graph($object_name, $modifier_name)
-    print(f"[export] retry capture returned: {capture_path}")
-    _payload_log(f"[export] retry capture returned: {capture_path}")
-    if not _copy_candidate(capture_path, "retry"):
-        raise SystemExit("Screenshot capture failed")
-
-if not target.exists():
-    _payload_log(f"[export] ERROR target missing after copy: {target}")
-    raise SystemExit(f"Screenshot missing on disk: {target}")
-else:
-    _payload_log(f"[export] verified screenshot exists at {target}")
-summary = {"frames": len(frames), "screenshot": str(target)}
-print("[export] SUMMARY\\n" + json.dumps(summary, indent=2))
-_payload_log(f"[export] SUMMARY -> {summary}")
-        """,
-    )
-    body = template.substitute(
+    _payload_log(f"[export] capture_node_graph returned: {capture_path}")
+    print(f"[export] capture_node_graph returned: {capture_path}")
+    target = Path($screenshot_abs)
+
+    def _copy_candidate(candidate_path, label):
+        candidate = Path(candidate_path) if candidate_path else None
+        if candidate and candidate.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # The capture lands in a temp dir; a rename avoids rewriting the PNG.
+            # Fall back to copying when the temp dir is on another filesystem.
+            try:
+                os.replace(candidate, target)
+            except OSError:
+                shutil.copy(candidate, target)
+            msg = f"[export] Screenshot saved to {target} via {label}"
+            print(msg)
+            _payload_log(msg)
+            return True
+        return False
+
+    if not _copy_candidate(capture_path, "primary"):
+        warn = "[export] Screenshot missing; retrying once..."
+        print(warn)
+        _payload_log(warn)
+        capture_path = capture_node_graph($object_name, $modifier_name)
+        print(f"[export] retry capture returned: {capture_path}")
+        _payload_log(f"[export] retry capture returned: {capture_path}")
+        if not _copy_candidate(capture_path, "retry"):
+            raise SystemExit("Screenshot capture failed")
+
+    if not target.exists():
+        _payload_log(f"[export] ERROR target missing after copy: {target}")
+        raise SystemExit(f"Screenshot missing on disk: {target}")
+    else:
+        _payload_log(f"[export] verified screenshot exists at {target}")
+    summary = {"frames": len(frames), "screenshot": str(target)}
+    print("[export] SUMMARY " + json.dumps(summary))
+    _payload_log(f"[export] SUMMARY -> {summary}")
+finally:
+    _log_fh.close()
+        """
+)
+
+
+def export_code(screenshot_rel: str, include_preamble: bool = True) -> str:
+    screenshot_abs = os.path.join(ARCHIVE_DIR, screenshot_rel)
+    code = common_preamble() if include_preamble else ""
+    body = _EXPORT_TMPL.substitute(
         object_name=repr(OBJECT_NAME),
         modifier_name=repr(MODIFIER_NAME),
         screenshot_abs=repr(screenshot_abs),
@@ -316,6 +679,32 @@ _payload_log(f"[export] SUMMARY -> {summary}")
     return code
 
 
+_PENDING_HEADER = re.compile(rb"(?m)^[ \t]*## Pending")
+
+
+def _insert_session_entry(notes_path: Path, entry: str) -> None:
+    """Insert ``entry`` before the first ``## Pending`` header, or append it.
+
+    The entry uses the file's own newline style, and only the bytes from the
+    insertion point onwards are rewritten.
+    """
+    with open(notes_path, "r+b") as fh:
+        data = fh.read()
+        newline = b"\r\n" if b"\r\n" in data else b"\n"
+        line = entry.encode("utf-8") + newline
+        match = _PENDING_HEADER.search(data)
+        if match:
+            rest = data[match.start():]
+            if not rest.endswith(b"\n"):
+                rest += newline
+            fh.seek(match.start())
+            fh.write(line + rest)
+        else:
+            if data and not data.endswith(b"\n"):
+                line = newline + line
+            fh.write(line)
+
+
 def update_session_notes(screenshot_rel: str, session_notes_path: Path | None = None) -> None:
     """Append a log entry to the session notes file.
 
@@ -332,19 +721,12 @@ def update_session_notes(screenshot_rel: str, session_notes_path: Path | None =
         notes_path.write_text(f"# Session Notes — {datetime.now().strftime('%Y-%m-%d')}\n\n## Key Actions\n{entry}\n\n## Pending / Next Steps\n")
         return
 
-    lines = notes_path.read_text().splitlines()
-    for idx, line in enumerate(lines):
-        if line.strip().startswith("## Pending"):
-            lines.insert(idx, entry)
-            break
-    else:
-        lines.append(entry)
-    notes_path.write_text("\n".join(lines) + "\n")
+    _insert_session_entry(notes_path, entry)
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--alias", default=DEFAULT_ALIAS, help="MCP alias to use")
+    parser.add_argument("--alias", help=f"MCP alias to use (default: {DEFAULT_ALIAS})")
     parser.add_argument("--skip-log", action="store_true", help="Skip session note update")
     parser.add_argument(
         "--mode",
@@ -352,6 +734,21 @@ def main(argv: List[str] | None = None) -> int:
         default="emit",
         help="emit (default) prints a combined payload for VS Code MCP; cli uses 'uvx blender-mcp'",
     )
+    parser.add_argument(
+        "--single-call",
+        action="store_true",
+        help="cli mode only: run all steps in one execute_blender_code call instead of one call per step",
+    )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="cli mode only: keep one MCP server process open for all steps instead of one 'uvx blender-mcp call' per step",
+    )
+    parser.add_argument(
+        "--server-cmd",
+        default="uvx blender-mcp",
+        help="MCP stdio server command used with --persistent (default: %(default)s)",
+    )
     parser.add_argument(
         "--graph-json-path",
         help="Path to a JSON file containing graph_json (or {\"graph_json\": {...}}).",
@@ -370,6 +767,13 @@ def main(argv: List[str] | None = None) -> int:
         help="Retain the built-in post-build node settings even when --graph-json-path is provided.",
     )
     args = parser.parse_args(argv)
+    if args.mode != "cli":
+        for flag in ("single_call", "persistent"):
+            if getattr(args, flag):
+                parser.error(f"--{flag.replace('_', '-')} requires --mode cli")
+    if args.persistent and args.alias is not None:
+        parser.error("--alias is not used with --persistent; select the server with --server-cmd")
+    alias = args.alias or DEFAULT_ALIAS
 
     graph_json = DEFAULT_GRAPH_JSON
     frame_specs = DEFAULT_FRAME_SPECS
@@ -386,13 +790,13 @@ def main(argv: List[str] | None = None) -> int:
         )
 
     if args.frame_specs_path:
-        frames_override = json.loads(Path(args.frame_specs_path).read_text())
+        frames_override = _read_json(Path(args.frame_specs_path))
         if not isinstance(frames_override, list):
             raise SystemExit("--frame-specs-path must point to a JSON list")
         frame_specs = frames_override
 
     if args.node_settings_path:
-        settings_override = json.loads(Path(args.node_settings_path).read_text())
+        settings_override = _read_json(Path(args.node_settings_path))
         if not isinstance(settings_override, dict):
             raise SystemExit("--node-settings-path must point to a JSON object")
         node_settings = settings_override
@@ -414,11 +818,17 @@ def main(argv: List[str] | None = None) -> int:
     step_builders.append(("export", export_builder))
 
     if args.mode == "cli":
-        for label, builder in step_builders:
-            run_mcp(builder(include_preamble=True), label, args.alias)
-
-        screenshot_path = REPO_ROOT / "_archive" / screenshot_rel
-        if not screenshot_path.exists():
+        with contextlib.ExitStack() as stack:
+            session = None
+            if args.persistent:
+                session = stack.enter_context(MCPStdioSession(shlex.split(args.server_cmd)))
+            if args.single_call:
+                run_mcp(combined_code(step_builders), "all", alias, session)
+            else:
+                for label, builder in step_builders:
+                    run_mcp(builder(include_preamble=True), label, alias, session)
+
+        if not os.path.exists(os.path.join(ARCHIVE_DIR, screenshot_rel)):
             raise SystemExit(
                 f"Expected screenshot {screenshot_rel} not found; check _archive/frame_validation_payload.log"
             )
@@ -430,10 +840,7 @@ def main(argv: List[str] | None = None) -> int:
         print("All steps completed successfully.")
         return 0
 
-    parts = [common_preamble()]
-    for label, builder in step_builders:
-        parts.append(f"# === Step: {label} ===\n" + builder(include_preamble=False))
-    combined = "\n\n".join(parts)
+    combined = combined_code(step_builders)
 
     instructions = textwrap.dedent(
         f"""
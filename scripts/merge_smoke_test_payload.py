@@ -45,18 +45,23 @@ cleared = clear_collection(SMOKE_TEST_COLLECTION)
 if cleared:
     print(f"Cleared {cleared} objects from {SMOKE_TEST_COLLECTION} collection")
 
+# Nodes and links shared by both graphs; each graph only adds its instance source.
+_SHARED_NODES = [
+    {"id": "grid", "type": "GeometryNodeMeshGrid"},
+    {"id": "to_points", "type": "GeometryNodeMeshToPoints"},
+    {"id": "instance", "type": "GeometryNodeInstanceOnPoints"},
+]
+_SHARED_LINKS = [
+    {"from": "grid", "from_socket": "Mesh", "to": "to_points", "to_socket": "Mesh"},
+    {"from": "to_points", "from_socket": "Points", "to": "instance", "to_socket": "Points"},
+]
+_OUTPUT_LINK = {"from": "instance", "from_socket": "Instances", "to": "__GROUP_OUTPUT__", "to_socket": "Geometry"}
+
 BASE_GRAPH_JSON = {
-    "nodes": [
-        {"id": "grid", "type": "GeometryNodeMeshGrid"},
-        {"id": "to_points", "type": "GeometryNodeMeshToPoints"},
-        {"id": "instance", "type": "GeometryNodeInstanceOnPoints"},
-        {"id": "cone", "type": "GeometryNodeMeshCone"},
-    ],
-    "links": [
-        {"from": "grid", "from_socket": "Mesh", "to": "to_points", "to_socket": "Mesh"},
-        {"from": "to_points", "from_socket": "Points", "to": "instance", "to_socket": "Points"},
+    "nodes": _SHARED_NODES + [{"id": "cone", "type": "GeometryNodeMeshCone"}],
+    "links": _SHARED_LINKS + [
         {"from": "cone", "from_socket": "Mesh", "to": "instance", "to_socket": "Instance"},
-        {"from": "instance", "from_socket": "Instances", "to": "__GROUP_OUTPUT__", "to_socket": "Geometry"},
+        _OUTPUT_LINK,
     ],
     "node_settings": {
         "grid": {"Vertices X": 10, "Vertices Y": 10, "Size X": 5.0, "Size Y": 5.0},
@@ -66,17 +71,10 @@ BASE_GRAPH_JSON = {
 }
 
 MERGE_GRAPH_JSON = {
-    "nodes": [
-        {"id": "grid", "type": "GeometryNodeMeshGrid"},
-        {"id": "to_points", "type": "GeometryNodeMeshToPoints"},
-        {"id": "instance", "type": "GeometryNodeInstanceOnPoints"},
-        {"id": "cube", "type": "GeometryNodeMeshCube"},
-    ],
-    "links": [
-        {"from": "grid", "from_socket": "Mesh", "to": "to_points", "to_socket": "Mesh"},
-        {"from": "to_points", "from_socket": "Points", "to": "instance", "to_socket": "Points"},
+    "nodes": _SHARED_NODES + [{"id": "cube", "type": "GeometryNodeMeshCube"}],
+    "links": _SHARED_LINKS + [
         {"from": "cube", "from_socket": "Mesh", "to": "instance", "to_socket": "Instance"},
-        {"from": "instance", "from_socket": "Instances", "to": "__GROUP_OUTPUT__", "to_socket": "Geometry"},
+        _OUTPUT_LINK,
     ],
     "node_settings": {
         "grid": {"Vertices X": 6, "Vertices Y": 6, "Size X": 3.0, "Size Y": 3.0},
@@ -122,21 +120,21 @@ summary = {
 }
 
 diff_summary = merge_result.get("diff_summary") or {}
-expected_removed_nodes = {"cone"}
-expected_removed_links = {
+expected_removed_nodes = frozenset({"cone"})
+expected_removed_links = frozenset({
     ("cone", "Mesh", "instance", "Instance"),
-}
+})
 
-removed_nodes = set(diff_summary.get("nodes_to_remove", []))
-removed_links = set(tuple(link) for link in diff_summary.get("links_to_remove", []))
+removed_nodes = frozenset(diff_summary.get("nodes_to_remove", ()))
+removed_links = frozenset(map(tuple, diff_summary.get("links_to_remove", ())))
 
-if not expected_removed_nodes.issubset(removed_nodes):
+if not removed_nodes >= expected_removed_nodes:
     print("\nFAILED: remove_extras did not remove expected nodes")
     print("Expected:", expected_removed_nodes)
     print("Actual:", removed_nodes)
     raise SystemExit(3)
 
-if not expected_removed_links.issubset(removed_links):
+if not removed_links >= expected_removed_links:
     print("\nFAILED: remove_extras did not remove expected links")
     print("Expected:", expected_removed_links)
     print("Actual:", removed_links)
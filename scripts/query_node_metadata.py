@@ -12,12 +12,25 @@ manual extras (reference/node_metadata_extras.json), and alias mappings
 from __future__ import annotations
 
 import argparse
+import bisect
 import difflib
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Any
 
+try:  # Optional C-accelerated JSON parsing; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # Optional C-accelerated fuzzy matching; difflib is the fallback.
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CATALOGUE = REPO_ROOT / "reference" / "geometry_nodes_complete_5_0.json"
 NODE_EXTRAS = REPO_ROOT / "reference" / "node_metadata_extras.json"
@@ -28,37 +41,102 @@ PATTERN_MAP_FILE = REPO_ROOT / "reference" / "node_patterns_map.json"
 def load_json(path: Path) -> Any:
     if not path.exists():
         return None
-    with open(path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    with open(path, "rb") as fh:
+        if orjson is not None and os.fstat(fh.fileno()).st_size:
+            # orjson parses straight from the mapped pages, skipping the read() copy.
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(fh.read())
 
 
 def build_indices(nodes: list[dict[str, Any]]) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
-    identifier_index = {}
-    label_index = {}
-    for entry in nodes:
-        identifier = entry.get("identifier")
-        label = entry.get("label", "")
-        if not identifier:
-            continue
-        identifier_index[identifier.lower()] = entry
-        if label:
-            label_index[label.lower()] = identifier
+    identifier_index = {entry["identifier"].lower(): entry for entry in nodes if entry.get("identifier")}
+    label_index = {
+        entry["label"].lower(): entry["identifier"]
+        for entry in nodes
+        if entry.get("identifier") and entry.get("label")
+    }
     return identifier_index, label_index
 
 
+_CHOICES_CACHE: tuple[Any, Any, tuple[str, ...]] | None = None
+
+
+def fuzzy_choices(identifier_index: dict[str, dict[str, Any]], label_index: dict[str, str]) -> tuple[str, ...]:
+    """Return the lowercased fuzzy-match candidates, shortest first.
+
+    The merged tuple is cached for as long as the same index objects are
+    passed in, so repeated lookups only pay for scoring.
+    """
+    global _CHOICES_CACHE
+    cached = _CHOICES_CACHE
+    if cached is None or cached[0] is not identifier_index or cached[1] is not label_index:
+        merged = dict.fromkeys(label_index)
+        merged.update(dict.fromkeys(identifier_index))
+        cached = (identifier_index, label_index, tuple(sorted(merged, key=len)))
+        _CHOICES_CACHE = cached
+    return cached[2]
+
+
+_NAME_CACHE: tuple[Any, Any, Any, dict[str, str], tuple[str, ...]] | None = None
+
+
+def name_lookup(
+    identifier_index: dict[str, dict[str, Any]],
+    label_index: dict[str, str],
+    aliases: dict[str, list[str]],
+) -> tuple[dict[str, str], tuple[str, ...]]:
+    """Return ``(names, sorted_names)`` mapping every lowercased name to its identifier.
+
+    Identifiers win over labels and labels over aliases, matching the order
+    ``resolve_query`` checks them in. ``sorted_names`` backs prefix lookups.
+    Cached while the same index objects are passed in.
+    """
+    global _NAME_CACHE
+    cached = _NAME_CACHE
+    if (
+        cached is None
+        or cached[0] is not identifier_index
+        or cached[1] is not label_index
+        or cached[2] is not aliases
+    ):
+        names = {key: key for key in identifier_index}
+        for label, ident in label_index.items():
+            names.setdefault(label, ident.lower())
+        for ident, alias_list in aliases.items():
+            # Skip metadata keys such as "_comment", as load_node_aliases does.
+            if ident.startswith("_") or not isinstance(alias_list, list):
+                continue
+            for alias in alias_list:
+                names.setdefault(alias.lower(), ident.lower())
+        cached = (identifier_index, label_index, aliases, names, tuple(sorted(names)))
+        _NAME_CACHE = cached
+    return cached[3], cached[4]
+
+
 def resolve_query(query: str, identifier_index: dict[str, dict[str, Any]], label_index: dict[str, str], aliases: dict[str, list[str]]) -> dict[str, Any] | None:
     q_lower = query.lower()
-    if q_lower in identifier_index:
-        return identifier_index[q_lower]
-    if q_lower in label_index:
-        ident = label_index[q_lower]
-        return identifier_index.get(ident.lower())
-    for ident, alias_list in aliases.items():
-        if any(q_lower == alias.lower() for alias in alias_list):
-            return identifier_index.get(ident.lower())
+    names, sorted_names = name_lookup(identifier_index, label_index, aliases)
+    if q_lower in names:
+        return identifier_index.get(names[q_lower])
+    # Prefix completion: prefer the shortest name that starts with the query.
+    if q_lower:
+        start = bisect.bisect_left(sorted_names, q_lower)
+        prefixed = []
+        for name in sorted_names[start:]:
+            if not name.startswith(q_lower):
+                break
+            prefixed.append(name)
+        if prefixed:
+            return identifier_index.get(names[min(prefixed, key=len)])
     # Fuzzy suggestions
-    choices = list(label_index.keys()) + list(identifier_index.keys())
-    matches = difflib.get_close_matches(q_lower, choices, n=1, cutoff=0.6)
+    choices = fuzzy_choices(identifier_index, label_index)
+    if process is not None:
+        # Choices and query are already lowercased, so skip rapidfuzz's processor.
+        best = process.extractOne(q_lower, choices, scorer=fuzz.ratio, processor=None, score_cutoff=60)
+        matches = [best[0]] if best else []
+    else:
+        matches = difflib.get_close_matches(q_lower, choices, n=1, cutoff=0.6)
     if matches:
         match = matches[0]
         if match in label_index:
@@ -69,47 +147,49 @@ def resolve_query(query: str, identifier_index: dict[str, dict[str, Any]], label
 
 
 def print_metadata(entry: dict[str, Any], extras: dict[str, Any] | None, pattern_map: dict[str, list[str]]) -> None:
+    parts = []
     identifier = entry.get("identifier")
     label = entry.get("label")
     category = entry.get("category")
-    print(f"Identifier: {identifier}")
+    parts.append(f"Identifier: {identifier}")
     if label:
-        print(f"Label     : {label}")
+        parts.append(f"Label     : {label}")
     if category:
-        print(f"Category  : {category}")
-    print("Inputs    :")
+        parts.append(f"Category  : {category}")
+    parts.append("Inputs    :")
     for inp in entry.get("inputs", []):
-        print(f"  - {inp.get('name')} ({inp.get('type')})")
-    print("Outputs   :")
+        parts.append(f"  - {inp.get('name')} ({inp.get('type')})")
+    parts.append("Outputs   :")
     for out in entry.get("outputs", []):
-        print(f"  - {out.get('name')} ({out.get('type')})")
+        parts.append(f"  - {out.get('name')} ({out.get('type')})")
 
     extra = extras.get(identifier, {}) if extras else {}
     description = extra.get("description")
     if description:
-        print("Description:")
-        print(f"  {description}")
+        parts.append("Description:")
+        parts.append(f"  {description}")
     if extra.get("inputs"):
-        print("Manual inputs:")
+        parts.append("Manual inputs:")
         for item in extra["inputs"]:
-            print(f"  - {item['name']}: {item['description']}")
+            parts.append(f"  - {item['name']}: {item['description']}")
     if extra.get("outputs"):
-        print("Manual outputs:")
+        parts.append("Manual outputs:")
         for item in extra["outputs"]:
-            print(f"  - {item['name']}: {item['description']}")
+            parts.append(f"  - {item['name']}: {item['description']}")
     if extra.get("properties"):
-        print("Properties:")
-        print(f"  {extra['properties']}")
+        parts.append("Properties:")
+        parts.append(f"  {extra['properties']}")
         if extra.get("properties_parameters"):
             for param in extra["properties_parameters"]:
-                print(f"    * {param['name']}: {param['description']}")
+                parts.append(f"    * {param['name']}: {param['description']}")
     if extra.get("notes"):
-        print("Notes:")
+        parts.append("Notes:")
         for note in extra["notes"]:
-            print(f"  - ({note['type']}) {note['text']}")
+            parts.append(f"  - ({note['type']}) {note['text']}")
     patterns = pattern_map.get(identifier, [])
     if patterns:
-        print(f"Patterns : {', '.join(patterns)}")
+        parts.append(f"Patterns : {', '.join(patterns)}")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main() -> None:
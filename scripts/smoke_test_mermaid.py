@@ -14,6 +14,7 @@ Uses a dedicated collection (MCP_Smoke_Test) to isolate test objects
 without destroying the user's scene.
 """
 
+import importlib.util
 import json
 from pathlib import Path
 
@@ -22,10 +23,12 @@ import bpy  # type: ignore
 REPO_ROOT = Path(__file__).resolve().parent.parent  # scripts/ -> repo root
 TOOLKIT_PATH = REPO_ROOT / "toolkit.py"
 
-# Load the toolkit into Blender's Python environment
-with open(TOOLKIT_PATH, "r", encoding="utf-8") as fh:
-    code = compile(fh.read(), str(TOOLKIT_PATH), "exec")
-exec(code, globals())
+# Load the toolkit into Blender's Python environment. Importing it from its file
+# lets Python reuse the cached bytecode in __pycache__ between runs.
+_toolkit_spec = importlib.util.spec_from_file_location("toolkit", TOOLKIT_PATH)
+_toolkit = importlib.util.module_from_spec(_toolkit_spec)
+_toolkit_spec.loader.exec_module(_toolkit)
+globals().update({name: value for name, value in vars(_toolkit).items() if not name.startswith("__")})
 
 # Use a dedicated collection for smoke tests (safe - doesn't destroy user's scene)
 SMOKE_TEST_COLLECTION = "MCP_Smoke_Test"
@@ -1,7 +1,7 @@
 """Report how many sockets in the catalogue support fields.
 
 Usage:
-    python scripts/verify_supports_field.py reference/geometry_nodes_complete_4_4.json
+    python scripts/verify_supports_field.py reference/geometry_nodes_complete_4_4.json [more.json ...]
 """
 
 from __future__ import annotations
@@ -10,10 +10,15 @@ import json
 import sys
 from pathlib import Path
 
+try:  # Optional C-accelerated JSON parsing; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_catalogue(path: Path):
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     if isinstance(data, dict):
         return data.get("nodes", [])
     if isinstance(data, list):
@@ -26,20 +31,17 @@ def count_supports_field(nodes):
     supported = 0
     by_node = {}
     for node in nodes:
-        for direction in ("inputs", "outputs"):
-            for socket in node.get(direction, []):
-                total += 1
-                if socket.get("supports_field"):
-                    supported += 1
-                    by_node.setdefault(node.get("identifier", "<unknown>"), 0)
-                    by_node[node.get("identifier", "<unknown>")] += 1
+        sockets = [*node.get("inputs", ()), *node.get("outputs", ())]
+        total += len(sockets)
+        count = sum(1 for socket in sockets if socket.get("supports_field"))
+        if count:
+            supported += count
+            identifier = node.get("identifier", "<unknown>")
+            by_node[identifier] = by_node.get(identifier, 0) + count
     return total, supported, by_node
 
 
-def main():
-    if len(sys.argv) < 2:
-        raise SystemExit("Usage: python scripts/verify_supports_field.py <catalogue.json>")
-    path = Path(sys.argv[1]).expanduser()
+def report(path: Path) -> None:
     nodes = load_catalogue(path)
     total, supported, by_node = count_supports_field(nodes)
     percent = (supported / total * 100) if total else 0.0
@@ -52,5 +54,14 @@ def main():
             print(f"  {name}: {count}")
 
 
+def main():
+    if len(sys.argv) < 2:
+        raise SystemExit("Usage: python scripts/verify_supports_field.py <catalogue.json> [...]")
+    for index, arg in enumerate(sys.argv[1:]):
+        if index:
+            print()
+        report(Path(arg).expanduser())
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
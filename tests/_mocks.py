@@ -0,0 +1,73 @@
+"""Lightweight bpy stand-ins shared by the diff and frame tests.
+
+Fixed ``__slots__`` layouts keep construction cheap, and custom-property
+access is a regular method rather than a per-instance lambda.
+"""
+
+
+class MockNamed:
+    """Anything the toolkit only reads ``.name`` from (sockets, link ends)."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class MockLocation:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+
+class MockNode:
+    """Node with custom properties exposed through get()/keys()/[]."""
+
+    __slots__ = ("name", "bl_idname", "location", "width", "parent", "_props")
+
+    def __init__(self, name, bl_idname="GeometryNodeMeshCone", location=(0, 0), width=150, props=None):
+        self.name = name
+        self.bl_idname = bl_idname
+        self.location = MockLocation(*location)
+        self.width = width
+        self.parent = None
+        self._props = props if props is not None else {}
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    def keys(self):
+        return list(self._props)
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+
+class MockFrame(MockNode):
+    """Frame node with the display attributes _export_frames reads."""
+
+    __slots__ = ("height", "label", "use_custom_color", "color", "shrink")
+
+    def __init__(self, name, location=(0, 0), width=300, height=200, label="",
+                 use_custom_color=False, color=(0.5, 0.5, 0.5), shrink=False, props=None):
+        super().__init__(name, "NodeFrame", location, width, props)
+        self.height = height
+        self.label = label
+        self.use_custom_color = use_custom_color
+        self.color = color
+        self.shrink = shrink
+
+
+class MockLink:
+    __slots__ = ("from_node", "from_socket", "to_node", "to_socket")
+
+    def __init__(self, from_node, from_socket_name, to_node, to_socket_name):
+        self.from_node = from_node
+        self.from_socket = MockNamed(from_socket_name)
+        self.to_node = to_node
+        self.to_socket = MockNamed(to_socket_name)
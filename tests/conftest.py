@@ -4,7 +4,9 @@ Provides bpy/mathutils mocks and a loaded toolkit namespace so all pure-Python
 functions can be tested without Blender.
 """
 
+import importlib.util
 import os
+import pickle
 import sys
 import types
 from pathlib import Path
@@ -34,7 +36,7 @@ def _install_mathutils_mock():
 
 
 def _load_toolkit(catalogue_version="5.0"):
-    """Exec toolkit.py and return its globals namespace."""
+    """Load toolkit.py as a module and return its globals namespace."""
     # Point at the correct catalogue files
     cat_name = f"geometry_nodes_complete_{catalogue_version.replace('.', '_')}.json"
     cat_path = REFERENCE_DIR / cat_name
@@ -47,13 +49,14 @@ def _load_toolkit(catalogue_version="5.0"):
         compat_path = REFERENCE_DIR / "socket_compat.csv"
     os.environ["GN_MCP_SOCKET_COMPAT_PATH"] = str(compat_path)
 
+    # A file-backed module spec lets Python reuse __pycache__ bytecode
+    # instead of recompiling toolkit.py on every pytest run.
     toolkit_path = REPO_ROOT / "toolkit.py"
-    with open(toolkit_path, "r", encoding="utf-8") as fh:
-        code = compile(fh.read(), str(toolkit_path), "exec")
+    spec = importlib.util.spec_from_file_location("toolkit", toolkit_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
 
-    ns = {"__file__": str(toolkit_path)}
-    exec(code, ns)
-    return ns
+    return module.__dict__
 
 
 def _reset_toolkit_caches(ns):
@@ -67,6 +70,9 @@ def _reset_toolkit_caches(ns):
     ns["_SOCKET_COMPAT"] = None
     ns["_SOCKET_COMPAT_SOURCE"] = None
     ns["_MERMAID_TYPE_MAP"] = None
+    ns["_NODE_ALIASES"] = None
+    ns["_NODE_ALIASES_SOURCE"] = None
+    ns["_NODE_ALIAS_LOOKUP"] = None
 
 
 # Install mocks once at import time so toolkit exec works
@@ -84,8 +90,36 @@ def _get_toolkit():
     return _TOOLKIT_NS
 
 
+@pytest.fixture(scope="session")
+def catalogue_snapshots():
+    """Parse each reference catalogue once per session.
+
+    Maps catalogue version to ``(resolved_path, pickled (nodes, index))``.
+    Unpickling gives every test its own copy of the entries, so a test that
+    mutates them cannot affect the next one.
+    """
+    ns = _get_toolkit()
+    snapshots = {}
+    for version in ("5.0", "4.4"):
+        cat_path = REFERENCE_DIR / f"geometry_nodes_complete_{version.replace('.', '_')}.json"
+        if cat_path.exists():
+            resolved = ns["_resolve_catalogue_path"](str(cat_path))
+            parsed = ns["_read_catalogue_file"](resolved)
+            snapshots[version] = (resolved, pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL))
+    return snapshots
+
+
+def _install_catalogue(ns, snapshots, version):
+    """Install a fresh copy of a parsed catalogue, as load_node_catalogue would."""
+    if version not in snapshots:
+        return
+    resolved, blob = snapshots[version]
+    ns["_NODE_CATALOGUE"], ns["_NODE_CATALOGUE_INDEX"] = pickle.loads(blob)
+    ns["_NODE_CATALOGUE_SOURCE"] = resolved
+
+
 @pytest.fixture
-def toolkit():
+def toolkit(catalogue_snapshots):
     """Return the toolkit namespace with caches reset for test isolation.
 
     Each test gets a clean slate — caches are cleared before the test runs,
@@ -94,18 +128,14 @@ def toolkit():
     ns = _get_toolkit()
     _reset_toolkit_caches(ns)
     # Pre-load the 5.0 catalogue so tests start with expected state
-    cat_path = REFERENCE_DIR / "geometry_nodes_complete_5_0.json"
-    if cat_path.exists():
-        ns["load_node_catalogue"](path=str(cat_path), force_reload=True)
+    _install_catalogue(ns, catalogue_snapshots, "5.0")
     return ns
 
 
 @pytest.fixture
-def toolkit_44():
+def toolkit_44(catalogue_snapshots):
     """Return the toolkit namespace loaded with the 4.4 catalogue."""
     ns = _get_toolkit()
     _reset_toolkit_caches(ns)
-    cat_path = REFERENCE_DIR / "geometry_nodes_complete_4_4.json"
-    if cat_path.exists():
-        ns["load_node_catalogue"](path=str(cat_path), force_reload=True)
+    _install_catalogue(ns, catalogue_snapshots, "4.4")
     return ns
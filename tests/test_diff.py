@@ -3,29 +3,21 @@
 import pytest
 import types
 
+from _mocks import MockLink, MockNamed, MockNode
+
 
 def _make_mock_node(name, bl_idname="GeometryNodeMeshCone", gn_mcp_id=None):
     """Create a mock node object."""
-    node = types.SimpleNamespace(
-        name=name,
-        bl_idname=bl_idname,
-    )
     # Simulate node[prop] access via get()
     props = {}
     if gn_mcp_id:
         props["gn_mcp_id"] = gn_mcp_id
-    node.get = lambda k, default=None: props.get(k, default)
-    return node
+    return MockNode(name, bl_idname, props=props)
 
 
 def _make_mock_link(from_node_name, from_socket_name, to_node_name, to_socket_name):
     """Create a mock link object."""
-    return types.SimpleNamespace(
-        from_node=types.SimpleNamespace(name=from_node_name),
-        from_socket=types.SimpleNamespace(name=from_socket_name),
-        to_node=types.SimpleNamespace(name=to_node_name),
-        to_socket=types.SimpleNamespace(name=to_socket_name),
-    )
+    return MockLink(MockNamed(from_node_name), from_socket_name, MockNamed(to_node_name), to_socket_name)
 
 
 def _make_mock_node_group(nodes, links):
@@ -0,0 +1,78 @@
+"""Tests for the Blender manual metadata extractor script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "extract_manual_metadata.py"
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    spec = importlib.util.spec_from_file_location("extract_manual_metadata", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+SAMPLE_RST = """\
+.. index:: Geometry Nodes; Mesh Grid
+.. _bpy.types.GeometryNodeMeshGrid:
+
+*********
+Grid Node
+*********
+
+Generates a planar mesh on the XY plane.
+
+Inputs
+======
+
+Size X
+   Side length of the plane in the X direction.
+
+Outputs
+=======
+
+Mesh
+   Standard geometry output.
+
+.. _bpy.types.GeometryNodeMeshCone:
+
+*********
+Cone Node
+*********
+
+Generates a cone mesh with :ref:`caps <bpy.types.Mesh>`.
+"""
+
+
+def test_anchor_pattern_matches_known_identifiers(extractor):
+    found = [m.group(1) for m in extractor.ANCHOR_PATTERN.finditer(SAMPLE_RST)]
+    assert found == ["GeometryNodeMeshGrid", "GeometryNodeMeshCone"]
+
+
+def test_admonition_indent_must_be_ascii_whitespace(extractor):
+    indented = ".. note::\n   Body text.\n\n"
+    nbsp_indented = ".. note::\n\u00a0\u00a0Body text.\n\n"
+    assert extractor._extract_admonitions(indented) == [{"type": "note", "text": "Body text."}]
+    assert extractor._extract_admonitions(nbsp_indented) == []
+
+
+def test_replace_roles(extractor):
+    text = "Uses :ref:`caps <bpy.types.Mesh>` and :kbd:`Tab` with **bold**"
+    assert extractor._replace_roles(text) == "Uses caps and Tab with bold"
+
+
+def test_extract_metadata_parses_sample(extractor, tmp_path):
+    (tmp_path / "grid.rst").write_text(SAMPLE_RST, encoding="utf-8")
+    (tmp_path / "unrelated.rst").write_text("Just prose.\n", encoding="utf-8")
+    data = extractor.extract_metadata(tmp_path)
+    assert set(data) == {"GeometryNodeMeshGrid", "GeometryNodeMeshCone"}
+    grid = data["GeometryNodeMeshGrid"]
+    assert grid["label"] == "Grid Node"
+    assert grid["description"] == "Generates a planar mesh on the XY plane."
+    assert grid["inputs"][0]["name"] == "Size X"
+    assert grid["outputs"][0]["name"] == "Mesh"
+    assert data["GeometryNodeMeshCone"]["description"] == "Generates a cone mesh with caps."
@@ -0,0 +1,262 @@
+"""Tests for the frame validation MCP driver script."""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "frame_validation_payload.py"
+
+
+@pytest.fixture(scope="module")
+def payload():
+    spec = importlib.util.spec_from_file_location("frame_validation_payload", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def fake_toolkit(tmp_path, monkeypatch):
+    """Point the payload preamble at a tiny toolkit and a private cache dir."""
+    toolkit_path = tmp_path / "toolkit.py"
+    toolkit_path.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setenv("GN_MCP_TOOLKIT_PATH", str(toolkit_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delitem(sys.modules, "_gn_mcp_toolkit_registry", raising=False)
+    return toolkit_path
+
+
+def _run_preamble(payload):
+    namespace = {}
+    exec(payload.common_preamble(), namespace)
+    return namespace
+
+
+def test_preamble_caches_bytecode_per_user(payload, fake_toolkit, tmp_path):
+    assert _run_preamble(payload)["VALUE"] == 1
+    cache_dir = tmp_path / "cache" / "gn_mcp_toolkit"
+    assert len(list(cache_dir.glob("toolkit_*.pyc"))) == 1
+    if hasattr(os, "getuid"):
+        assert cache_dir.stat().st_mode & 0o077 == 0
+
+
+def test_preamble_recompiles_corrupt_cache(payload, fake_toolkit, tmp_path):
+    _run_preamble(payload)
+    (cached,) = (tmp_path / "cache" / "gn_mcp_toolkit").glob("toolkit_*.pyc")
+    cached.write_bytes(cached.read_bytes()[:5])
+    del sys.modules["_gn_mcp_toolkit_registry"]
+
+    assert _run_preamble(payload)["VALUE"] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership check")
+def test_preamble_ignores_cache_in_shared_dir(payload, fake_toolkit, tmp_path):
+    import marshal
+
+    _run_preamble(payload)
+    cache_dir = tmp_path / "cache" / "gn_mcp_toolkit"
+    (cached,) = cache_dir.glob("toolkit_*.pyc")
+    cached.write_bytes(marshal.dumps(compile("VALUE = 2\n", "planted", "exec")))
+    cache_dir.chmod(0o777)
+    del sys.modules["_gn_mcp_toolkit_registry"]
+
+    assert _run_preamble(payload)["VALUE"] == 1
+
+
+def test_export_step_closes_its_log(payload):
+    code = payload.export_code("shot.png", include_preamble=False)
+    compile(code, "export", "exec")
+    assert "atexit" not in code
+    assert code.rstrip().endswith("finally:\n    _log_fh.close()")
+
+
+def test_pump_stream_handles_text_only_sink(payload):
+    import io
+    import subprocess
+
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'caf\\xc3\\xa9 \\xff\\n')"],
+        stdout=subprocess.PIPE,
+        bufsize=0,
+    )
+    sink = io.StringIO()
+    payload._pump_stream(proc.stdout, sink)
+    proc.wait()
+    assert sink.getvalue() == "café �\n"
+
+
+FAKE_MCP_SERVER = """\
+import json, sys
+
+mode = sys.argv[1]
+for line in sys.stdin:
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    if message["method"] == "initialize":
+        if mode == "init-error":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -1, "message": "nope"}}
+        else:
+            print("starting up (not JSON)", flush=True)
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {"protocolVersion": "2024-11-05"}}
+    else:
+        print(json.dumps({"jsonrpc": "2.0", "method": "notifications/message"}), flush=True)
+        text = "Error executing code: boom" if mode == "blender-error" else "Code executed successfully: ok"
+        reply = {"jsonrpc": "2.0", "id": message["id"], "result": {"content": [{"type": "text", "text": text}]}}
+    print(json.dumps(reply), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_server(tmp_path):
+    script = tmp_path / "fake_mcp_server.py"
+    script.write_text(FAKE_MCP_SERVER, encoding="utf-8")
+    return lambda mode: [sys.executable, str(script), mode]
+
+
+def test_session_runs_steps_and_skips_non_json_lines(payload, fake_server, capsys):
+    with payload.MCPStdioSession(fake_server("ok")) as session:
+        proc = session.proc
+        payload.run_mcp("print(1)", "build", "blender", session=session)
+    assert proc.returncode == 0
+    assert "Code executed successfully: ok\n" in capsys.readouterr().out
+
+
+def test_session_detects_blender_side_error_text(payload, fake_server):
+    with payload.MCPStdioSession(fake_server("blender-error")) as session:
+        with pytest.raises(SystemExit, match="Step 'build' failed inside Blender"):
+            payload.run_mcp("raise RuntimeError", "build", "blender", session=session)
+
+
+def test_session_kills_server_when_initialize_fails(payload, fake_server, monkeypatch):
+    import subprocess
+
+    started = []
+    real_popen = subprocess.Popen
+
+    def recording_popen(*args, **kwargs):
+        started.append(real_popen(*args, **kwargs))
+        return started[-1]
+
+    monkeypatch.setattr(payload.subprocess, "Popen", recording_popen)
+    session = payload.MCPStdioSession(fake_server("init-error"))
+    with pytest.raises(SystemExit, match="MCP initialize failed"):
+        session.__enter__()
+    assert session.proc is None
+    assert started[0].poll() is not None
+
+
+def test_json_assignment_reflects_in_place_edits(payload):
+    settings = {"grid": {"Size X": 1.0}}
+    first = payload.json_assignment("NODE_SETTINGS", settings)
+    settings["grid"]["Size X"] = 2.0
+    namespace = {"_json_loads": json.loads}
+    exec(payload.json_assignment("NODE_SETTINGS", settings), namespace)
+    assert namespace["NODE_SETTINGS"] == {"grid": {"Size X": 2.0}}
+    assert first != payload.json_assignment("NODE_SETTINGS", settings)
+
+
+ENTRY = "- Automated MCP frame validation via script (shot.png)."
+
+
+@pytest.mark.parametrize(
+    "before, after",
+    [
+        (
+            "# Notes\n\n## Key Actions\n- a\n\n## Pending / Next Steps\n- b\n\n## Pending (old)\n",
+            f"# Notes\n\n## Key Actions\n- a\n\n{ENTRY}\n## Pending / Next Steps\n- b\n\n## Pending (old)\n",
+        ),
+        (
+            "# Notes\r\n\r\n## Key Actions\r\n- a\r\n\r\n## Pending / Next Steps\r\n",
+            f"# Notes\r\n\r\n## Key Actions\r\n- a\r\n\r\n{ENTRY}\r\n## Pending / Next Steps\r\n",
+        ),
+        ("# Notes\n- a", f"# Notes\n- a\n{ENTRY}\n"),
+        ("# Notes\n## Pending", f"# Notes\n{ENTRY}\n## Pending\n"),
+    ],
+    ids=["first-of-two-headers", "crlf", "no-header", "header-without-newline"],
+)
+def test_update_session_notes_inserts_before_first_pending(payload, tmp_path, before, after):
+    notes = tmp_path / "notes.md"
+    notes.write_bytes(before.encode("utf-8"))
+    payload.update_session_notes("shot.png", session_notes_path=notes)
+    assert notes.read_bytes() == after.encode("utf-8")
+
+
+def test_preamble_registry_hit_keeps_current_repo_root(payload, fake_toolkit, tmp_path, monkeypatch):
+    fake_toolkit.write_text("TOKEN = object()\n", encoding="utf-8")
+    first = _run_preamble(payload)
+
+    other_root = tmp_path / "other_checkout"
+    monkeypatch.setattr(payload, "REPO_ROOT", other_root)
+    namespace = {}
+    exec(payload.common_preamble.__wrapped__(), namespace)
+
+    assert namespace["TOKEN"] is first["TOKEN"]
+    assert namespace["REPO_ROOT"] == other_root
+    (snapshot,) = sys.modules["_gn_mcp_toolkit_registry"].loaded.values()
+    assert "REPO_ROOT" not in snapshot
+
+
+def test_build_step_node_index_skips_group_io(payload, monkeypatch):
+    import types
+
+    node_group = {}
+    bpy = types.SimpleNamespace(data=types.SimpleNamespace(node_groups={"NG": node_group}))
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    nodes = {
+        "grid": types.SimpleNamespace(name="Grid"),
+        "__GROUP_INPUT__": types.SimpleNamespace(name="Group Input"),
+        "__GROUP_OUTPUT__": types.SimpleNamespace(name="Group Output"),
+    }
+    namespace = {
+        "json": json,
+        "_json_loads": json.loads,
+        "SPECIAL_NODE_TYPES": {"__GROUP_INPUT__": "NodeGroupInput", "__GROUP_OUTPUT__": "NodeGroupOutput"},
+        "clear_collection": lambda name: 0,
+        "build_graph_from_json": lambda *a, **kw: {"success": True, "node_group_name": "NG", "nodes": nodes},
+    }
+    exec(payload.build_code(include_preamble=False), namespace)
+    assert node_group[payload.NODE_INDEX_PROP] == {"grid": "Grid"}
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--single-call"], "--single-call requires --mode cli"),
+        (["--persistent"], "--persistent requires --mode cli"),
+        (["--mode", "cli", "--persistent", "--alias", "other"], "--alias is not used with --persistent"),
+    ],
+)
+def test_main_rejects_ignored_flag_combinations(payload, capsys, argv, message):
+    with pytest.raises(SystemExit) as exc_info:
+        payload.main(argv)
+    assert exc_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"instance": {"Scale": (0.5, 0.5, 0.5)}},
+        {1: "int key"},
+        {"grid": {"Size X": float("inf")}},
+    ],
+)
+def test_json_assignment_keeps_values_json_would_change(payload, value):
+    code = payload.json_assignment("NODE_SETTINGS", value)
+    assert "_json_loads" not in code
+    namespace = {}
+    exec(code, namespace)
+    assert namespace["NODE_SETTINGS"] == value
+
+
+def test_json_assignment_keeps_nan(payload):
+    import math
+
+    namespace = {}
+    exec(payload.json_assignment("NODE_SETTINGS", {"grid": {"Size X": float("nan")}}), namespace)
+    assert math.isnan(namespace["NODE_SETTINGS"]["grid"]["Size X"])
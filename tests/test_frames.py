@@ -3,22 +3,15 @@
 import pytest
 import types
 
+from _mocks import MockFrame, MockLink, MockNode
+
 
 def _make_mock_node(name, bl_idname="GeometryNodeMeshCone", gn_mcp_id=None, location=(0, 0), width=150):
     """Create a mock node object with location and size."""
     props = {}
     if gn_mcp_id:
         props["gn_mcp_id"] = gn_mcp_id
-
-    node = types.SimpleNamespace(
-        name=name,
-        bl_idname=bl_idname,
-        location=types.SimpleNamespace(x=location[0], y=location[1]),
-        width=width,
-    )
-    node.get = lambda k, default=None: props.get(k, default)
-    node.keys = lambda: list(props.keys())
-    return node
+    return MockNode(name, bl_idname, location=location, width=width, props=props)
 
 
 def _make_mock_frame(name, gn_mcp_frame_id=None, location=(0, 0), width=300, height=200,
@@ -31,30 +24,22 @@ def _make_mock_frame(name, gn_mcp_frame_id=None, location=(0, 0), width=300, hei
     if description:
         props["description"] = description
 
-    frame = types.SimpleNamespace(
-        name=name,
-        bl_idname="NodeFrame",
-        location=types.SimpleNamespace(x=location[0], y=location[1]),
+    return MockFrame(
+        name,
+        location=location,
         width=width,
         height=height,
         label=label,
         use_custom_color=use_custom_color,
         color=color,
         shrink=shrink,
+        props=props,
     )
-    frame.get = lambda k, default=None: props.get(k, default)
-    frame.keys = lambda: list(props.keys())
-    return frame
 
 
 def _make_mock_link(from_node, from_socket_name, to_node, to_socket_name):
     """Create a mock link object with actual node references."""
-    return types.SimpleNamespace(
-        from_node=from_node,
-        from_socket=types.SimpleNamespace(name=from_socket_name),
-        to_node=to_node,
-        to_socket=types.SimpleNamespace(name=to_socket_name),
-    )
+    return MockLink(from_node, from_socket_name, to_node, to_socket_name)
 
 
 def _make_mock_node_group(nodes, links):
@@ -139,6 +124,42 @@ class TestExportFrames:
         assert len(result) == 1
         assert "grid" in result[0]["nodes"]
 
+    def test_containment_keeps_position_order_and_bounds(self, toolkit):
+        frame = _make_mock_frame(
+            "Frame",
+            gn_mcp_frame_id="test_frame",
+            location=(0, 100),
+            width=200,
+            height=100,
+        )
+        ng = _make_mock_node_group([frame], [])
+        node_positions = {
+            "right_edge": [200, 50],
+            "too_far_right": [201, 50],
+            "left_edge": [0, 0],
+            "below": [100, -1],
+            "middle": [100, 100],
+        }
+
+        result = toolkit["_export_frames"](ng, node_positions)
+        assert result[0]["nodes"] == ["right_edge", "left_edge", "middle"]
+
+    def test_parented_nodes_take_precedence_over_bounds(self, toolkit):
+        frame = _make_mock_frame(
+            "Frame",
+            gn_mcp_frame_id="test_frame",
+            location=(0, 100),
+            width=200,
+            height=100,
+        )
+        parented = _make_mock_node("grid", gn_mcp_id="grid", location=(500, 500))
+        parented.parent = frame
+        overlapping = _make_mock_node("cone", gn_mcp_id="cone", location=(50, 50))
+        ng = _make_mock_node_group([frame, parented, overlapping], [])
+
+        result = toolkit["_export_frames"](ng, {})
+        assert result[0]["nodes"] == ["grid"]
+
     def test_exports_frame_with_color(self, toolkit):
         frame = _make_mock_frame(
             "ColorFrame",
@@ -214,7 +235,6 @@ class TestClearManagedFrames:
             "Manual",
             gn_mcp_frame_id=None,
         )
-        manual.keys = lambda: []
 
         nodes = [managed, manual]
         node_group = types.SimpleNamespace(nodes=nodes)
@@ -225,31 +245,12 @@ class TestClearManagedFrames:
         assert manual in node_group.nodes
 
 
-class _MockFrameNode:
-    """Mock frame node that supports item assignment like Blender nodes."""
-    def __init__(self, name):
-        self.name = name
-        self.bl_idname = "NodeFrame"
-        self.location = types.SimpleNamespace(x=0, y=0)
-        self.width = 200
-        self.height = 100
-        self.label = ""
-        self.use_custom_color = False
-        self.color = (0.5, 0.5, 0.5)
-        self.shrink = False
-        self._props = {}
-
-    def __setitem__(self, key, value):
-        self._props[key] = value
-
-    def __getitem__(self, key):
-        return self._props[key]
-
-    def get(self, key, default=None):
-        return self._props.get(key, default)
+class _MockFrameNode(MockFrame):
+    """Mock frame node as created by node_group.nodes.new("NodeFrame")."""
+    __slots__ = ()
 
-    def keys(self):
-        return list(self._props.keys())
+    def __init__(self, name):
+        super().__init__(name, width=200, height=100)
 
 
 class TestApplyFramesDuplicateIds:
@@ -357,6 +358,21 @@ class TestAutoFrameByConnectivity:
         assert len(result) == 1
         assert set(result[0]["nodes"]) == {"a", "b"}
 
+    def test_diamond_lists_each_node_once(self, toolkit):
+        """Nodes reachable along several paths appear once in their component."""
+        a, b, c, d = (_make_mock_node(n, gn_mcp_id=n) for n in "abcd")
+        links = [
+            _make_mock_link(a, "Out", b, "In"),
+            _make_mock_link(a, "Out", c, "In"),
+            _make_mock_link(b, "Out", d, "A"),
+            _make_mock_link(c, "Out", d, "B"),
+        ]
+        result = toolkit["_auto_frame_by_connectivity"](_make_mock_node_group([a, b, c, d], links))
+
+        assert len(result) == 1
+        assert sorted(result[0]["nodes"]) == ["a", "b", "c", "d"]
+        assert result[0]["nodes"][0] == "a"
+
 
 # -- Auto-framing by type tests ----------------------------------------------
 
@@ -423,6 +439,23 @@ class TestAutoFrameByType:
             assert "Group Output" not in frame["nodes"]
             assert "frame" not in frame["nodes"]
 
+    def test_first_matching_keyword_wins_and_other_collects_rest(self, toolkit):
+        """Category keywords are checked in order; unmatched types go to Other."""
+        nodes = [
+            _make_mock_node("m2c", "GeometryNodeMeshToCurve", gn_mcp_id="m2c"),
+            _make_mock_node("grid", "GeometryNodeMeshGrid", gn_mcp_id="grid"),
+            _make_mock_node("rand", "FunctionNodeRandomValue", gn_mcp_id="rand"),
+            _make_mock_node("cmp", "FunctionNodeCompare", gn_mcp_id="cmp"),
+        ]
+        result = toolkit["_auto_frame_by_type"](_make_mock_node_group(nodes, []))
+
+        by_id = {f["id"]: f for f in result}
+        assert by_id["type_mesh"]["nodes"] == ["m2c", "grid"]
+        assert by_id["type_other"]["nodes"] == ["rand", "cmp"]
+        by_id["type_mesh"]["color"][0] = 1.0
+        again = toolkit["_auto_frame_by_type"](_make_mock_node_group(nodes, []))
+        assert again[0]["color"] == [0.2, 0.6, 0.8, 0.8]
+
 
 # -- auto_frame_graph wrapper tests ------------------------------------------
 
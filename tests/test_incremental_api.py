@@ -7,6 +7,108 @@ creation in Blender need to run in a Blender context.
 import types
 import pytest
 
+from _mocks import MockNamed
+
+_BL_IDNAME_BY_TYPE = {
+    t: f"NodeSocket{t.title().replace('_', '')}"
+    for t in ("FLOAT", "INT", "VALUE", "GEOMETRY", "VECTOR", "STRING", "BOOLEAN", "RGBA")
+}
+
+
+def _mock_socket_idname(socket_type):
+    return _BL_IDNAME_BY_TYPE.get(socket_type) or f"NodeSocket{socket_type.title().replace('_', '')}"
+
+
+class _BLRna:
+    __slots__ = ("identifier",)
+
+    def __init__(self, identifier):
+        self.identifier = identifier
+
+
+_BL_RNA_BY_IDNAME = {}
+
+
+def _bl_rna_for(idname):
+    """Shared read-only ``bl_rna`` stand-in for a socket idname."""
+    rna = _BL_RNA_BY_IDNAME.get(idname)
+    if rna is None:
+        rna = _BL_RNA_BY_IDNAME[idname] = _BLRna(idname)
+    return rna
+
+
+class _MockSocket:
+    __slots__ = ("name", "type", "is_output", "is_linked", "default_value", "bl_idname", "node", "bl_rna")
+
+    def __init__(self, name, socket_type, is_output, is_linked, bl_idname):
+        self.name = name
+        self.type = socket_type
+        self.is_output = is_output
+        self.is_linked = is_linked
+        self.bl_idname = bl_idname
+
+
+class _MockNode:
+    __slots__ = ("name", "bl_idname", "label", "inputs", "outputs")
+
+    def __init__(self, name, bl_idname, inputs, outputs, label=""):
+        self.name = name
+        self.bl_idname = bl_idname
+        self.label = label
+        self.inputs = inputs
+        self.outputs = outputs
+
+
+class _InputsView:
+    """Iterable, name-indexable stand-in for ``node.inputs``."""
+
+    __slots__ = ("_inputs", "_by_name")
+
+    def __init__(self, inputs):
+        self._inputs = inputs
+        # Reversed so the first socket with a duplicated name wins, as in Blender
+        self._by_name = {i.name: i for i in reversed(inputs)}
+
+    def __iter__(self):
+        return iter(self._inputs)
+
+    def __contains__(self, key):
+        return key in self._by_name
+
+    def __getitem__(self, key):
+        return self._by_name.get(key)
+
+
+class _NodesCollection:
+    """``node_group.nodes`` stand-in: iterable, with a ``new()`` factory."""
+
+    __slots__ = ("_nodes", "new")
+
+    def __init__(self, nodes, new):
+        self._nodes = nodes
+        self.new = new
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+
+class _LinksCollection:
+    __slots__ = ("new",)
+
+    def __init__(self, new):
+        self.new = new
+
+
+class _MockLink:
+    __slots__ = ("from_node", "from_socket", "to_node", "to_socket", "is_valid")
+
+    def __init__(self, from_node, from_socket, to_node, to_socket, is_valid=True):
+        self.from_node = from_node
+        self.from_socket = from_socket
+        self.to_node = to_node
+        self.to_socket = to_socket
+        self.is_valid = is_valid
+
 
 # ============================================================================
 # resolve_node_type tests (pure Python - no Blender required)
@@ -44,6 +146,24 @@ def test_resolve_node_type_by_alias_case_insensitive(toolkit):
     assert resolve("Scatter") == "GeometryNodeDistributePointsOnFaces"
 
 
+def test_resolve_node_type_alias_lookup_follows_reload(toolkit, tmp_path):
+    """Reloading aliases rebuilds the lookup; the first identifier listing an alias wins."""
+    resolve = toolkit["resolve_node_type"]
+    alias_path = tmp_path / "aliases.json"
+    alias_path.write_text(
+        '{"_comment": "x", "GeometryNodeMeshCube": ["Blocky"], "GeometryNodeMeshCone": ["blocky"]}',
+        encoding="utf-8",
+    )
+    try:
+        toolkit["load_node_aliases"](path=str(alias_path), force_reload=True)
+        assert resolve("blocky") == "GeometryNodeMeshCone"
+        assert resolve("BLOCKY") == "GeometryNodeMeshCube"
+        assert resolve("scatter") is None
+    finally:
+        toolkit["load_node_aliases"](force_reload=True)
+    assert resolve("scatter") == "GeometryNodeDistributePointsOnFaces"
+
+
 def test_resolve_node_type_by_identifier(toolkit):
     """Should pass through full identifiers."""
     resolve = toolkit["resolve_node_type"]
@@ -84,95 +204,65 @@ def test_resolve_node_type_stripped_prefix(toolkit):
 
 def _make_mock_socket(name, socket_type, is_output=False, is_linked=False):
     """Create a mock socket object."""
-    socket = types.SimpleNamespace(
-        name=name,
-        type=socket_type,
-        is_output=is_output,
-        is_linked=is_linked,
-        default_value=0.0,
-        bl_idname=f"NodeSocket{socket_type.title()}",
-    )
+    socket = _MockSocket(name, socket_type, is_output, is_linked, _mock_socket_idname(socket_type))
+    socket.default_value = 0.0
     return socket
 
 
 def _make_mock_node(name, bl_idname, inputs=None, outputs=None):
     """Create a mock node with inputs/outputs."""
-    node = types.SimpleNamespace(
-        name=name,
-        bl_idname=bl_idname,
-        inputs={},
-        outputs=[],
-    )
+    node = _MockNode(name, bl_idname, {}, [])
 
-    # Build inputs dict and list
     if inputs:
         for inp in inputs:
-            node.inputs[inp.name] = inp
             inp.node = node
+        node.inputs = _InputsView(inputs)
 
     if outputs:
         for out in outputs:
             out.node = node
             node.outputs.append(out)
 
-    # Make inputs iterable
-    if inputs:
-        node.inputs = type('InputsDict', (), {
-            '__iter__': lambda self: iter(inputs),
-            '__contains__': lambda self, key: any(i.name == key for i in inputs),
-            '__getitem__': lambda self, key: next((i for i in inputs if i.name == key), None),
-        })()
-
     return node
 
 
+# (label, input specs, output specs) for the node types _make_mock_node_group builds
+_MOCK_NODE_TEMPLATES = {
+    "GeometryNodeMeshGrid": (
+        "Grid",
+        (("Size X", "FLOAT"), ("Size Y", "FLOAT"), ("Vertices X", "INT"), ("Vertices Y", "INT")),
+        (("Mesh", "GEOMETRY"),),
+    ),
+    "GeometryNodeMeshCone": (
+        "Cone",
+        (("Vertices", "INT"), ("Radius Top", "FLOAT"), ("Radius Bottom", "FLOAT"), ("Depth", "FLOAT")),
+        (("Mesh", "GEOMETRY"),),
+    ),
+}
+
+
 def _make_mock_node_group():
     """Create a mock node group with nodes.new() capability."""
     nodes_list = []
 
     def new(node_type):
-        # Create a basic node based on type
-        if node_type == "GeometryNodeMeshGrid":
-            node = _make_mock_node(
-                "Grid",
-                node_type,
-                inputs=[
-                    _make_mock_socket("Size X", "FLOAT"),
-                    _make_mock_socket("Size Y", "FLOAT"),
-                    _make_mock_socket("Vertices X", "INT"),
-                    _make_mock_socket("Vertices Y", "INT"),
-                ],
-                outputs=[
-                    _make_mock_socket("Mesh", "GEOMETRY", is_output=True),
-                ],
-            )
-        elif node_type == "GeometryNodeMeshCone":
+        template = _MOCK_NODE_TEMPLATES.get(node_type)
+        if template is None:
+            node = _make_mock_node(f"Node_{node_type}", node_type, [], [])
+        else:
+            label, input_specs, output_specs = template
             node = _make_mock_node(
-                "Cone",
+                label,
                 node_type,
-                inputs=[
-                    _make_mock_socket("Vertices", "INT"),
-                    _make_mock_socket("Radius Top", "FLOAT"),
-                    _make_mock_socket("Radius Bottom", "FLOAT"),
-                    _make_mock_socket("Depth", "FLOAT"),
-                ],
-                outputs=[
-                    _make_mock_socket("Mesh", "GEOMETRY", is_output=True),
-                ],
+                inputs=[_make_mock_socket(n, t) for n, t in input_specs],
+                outputs=[_make_mock_socket(n, t, is_output=True) for n, t in output_specs],
             )
-        else:
-            node = _make_mock_node(f"Node_{node_type}", node_type, [], [])
         nodes_list.append(node)
         return node
 
-    nodes = types.SimpleNamespace(
-        new=new,
-        __iter__=lambda self: iter(nodes_list),
-    )
-
     return types.SimpleNamespace(
-        nodes=nodes,
-        links=types.SimpleNamespace(new=lambda f, t: types.SimpleNamespace(is_valid=True)),
+        nodes=_NodesCollection(nodes_list, new),
+        links=_LinksCollection(lambda f, t: types.SimpleNamespace(is_valid=True)),
     )
 
 
@@ -183,6 +273,7 @@ def test_add_node_by_label(toolkit):
 
     node = add_node(ng, "Grid")
     assert node.bl_idname == "GeometryNodeMeshGrid"
+    assert list(ng.nodes) == [node]
 
 
 def test_add_node_by_alias(toolkit):
@@ -245,33 +336,6 @@ def test_add_node_invalid_setting_raises(toolkit):
 # auto_link tests (require full mock setup)
 # ============================================================================
 
-def _make_linkable_mock_nodes():
-    """Create mock nodes that can be linked together."""
-    # Grid node outputs geometry
-    grid = _make_mock_node(
-        "Grid",
-        "GeometryNodeMeshGrid",
-        outputs=[_make_mock_socket("Mesh", "GEOMETRY", is_output=True)],
-    )
-    grid.outputs[0].bl_idname = "NodeSocketGeometry"
-
-    # Distribute Points takes geometry input
-    distribute = _make_mock_node(
-        "Distribute Points On Faces",
-        "GeometryNodeDistributePointsOnFaces",
-        inputs=[
-            _make_mock_socket("Mesh", "GEOMETRY"),
-            _make_mock_socket("Density", "FLOAT"),
-        ],
-    )
-    distribute.inputs = list(distribute.inputs)  # Make iterable
-    for inp in distribute.inputs:
-        inp.bl_idname = "NodeSocketGeometry" if inp.type == "GEOMETRY" else "NodeSocketFloat"
-        inp.node = distribute
-
-    return grid, distribute
-
-
 def test_auto_link_finds_compatible_sockets(toolkit):
     """auto_link should find compatible socket pairs."""
     # This test would need full socket compatibility validation mocked
@@ -329,34 +393,32 @@ def test_incremental_api_workflow_documented():
     pass  # Documentation test
 
 
-def test_resolve_common_aliases(toolkit):
+_COMMON_ALIASES = types.MappingProxyType({
+    "scatter": "GeometryNodeDistributePointsOnFaces",
+    "instance": "GeometryNodeInstanceOnPoints",
+    "box": "GeometryNodeMeshCube",
+    "plane": "GeometryNodeMeshGrid",
+    "sphere": "GeometryNodeMeshUVSphere",
+    "random": "FunctionNodeRandomValue",
+    "math": "ShaderNodeMath",
+    "mix": "ShaderNodeMix",
+    "remap": "ShaderNodeMapRange",
+    "extrude": "GeometryNodeExtrudeMesh",
+    "subdivide": "GeometryNodeSubdivideMesh",
+    "boolean": "GeometryNodeMeshBoolean",
+    "join": "GeometryNodeJoinGeometry",
+    "transform": "GeometryNodeTransform",
+    "raycast": "GeometryNodeRaycast",
+    "position": "GeometryNodeInputPosition",
+    "index": "GeometryNodeInputIndex",
+    "normal": "GeometryNodeInputNormal",
+})
+
+
+@pytest.mark.parametrize("alias,expected_id", _COMMON_ALIASES.items())
+def test_resolve_common_aliases(toolkit, alias, expected_id):
     """Verify all common aliases resolve correctly."""
-    resolve = toolkit["resolve_node_type"]
-
-    common_aliases = {
-        "scatter": "GeometryNodeDistributePointsOnFaces",
-        "instance": "GeometryNodeInstanceOnPoints",
-        "box": "GeometryNodeMeshCube",
-        "plane": "GeometryNodeMeshGrid",
-        "sphere": "GeometryNodeMeshUVSphere",
-        "random": "FunctionNodeRandomValue",
-        "math": "ShaderNodeMath",
-        "mix": "ShaderNodeMix",
-        "remap": "ShaderNodeMapRange",
-        "extrude": "GeometryNodeExtrudeMesh",
-        "subdivide": "GeometryNodeSubdivideMesh",
-        "boolean": "GeometryNodeMeshBoolean",
-        "join": "GeometryNodeJoinGeometry",
-        "transform": "GeometryNodeTransform",
-        "raycast": "GeometryNodeRaycast",
-        "position": "GeometryNodeInputPosition",
-        "index": "GeometryNodeInputIndex",
-        "normal": "GeometryNodeInputNormal",
-    }
-
-    for alias, expected_id in common_aliases.items():
-        result = resolve(alias)
-        assert result == expected_id, f"Alias '{alias}' should resolve to {expected_id}, got {result}"
+    assert toolkit["resolve_node_type"](alias) == expected_id
 
 
 # ============================================================================
@@ -365,40 +427,20 @@ def test_resolve_common_aliases(toolkit):
 
 def _make_mock_link(from_node, from_socket_name, to_node, to_socket_name, is_valid=True):
     """Create a mock link object."""
-    from_socket = types.SimpleNamespace(name=from_socket_name)
-    to_socket = types.SimpleNamespace(name=to_socket_name)
-    return types.SimpleNamespace(
-        from_node=from_node,
-        from_socket=from_socket,
-        to_node=to_node,
-        to_socket=to_socket,
-        is_valid=is_valid,
-    )
+    return _MockLink(from_node, MockNamed(from_socket_name), to_node, MockNamed(to_socket_name), is_valid)
 
 
 def _make_describe_mock_socket(name, socket_type, is_output=False, is_linked=False):
     """Create a mock socket for describe tests."""
-    socket = types.SimpleNamespace(
-        name=name,
-        type=socket_type,
-        is_output=is_output,
-        is_linked=is_linked,
-        bl_idname=f"NodeSocket{socket_type.title().replace('_', '')}",
-    )
+    socket = _MockSocket(name, socket_type, is_output, is_linked, _mock_socket_idname(socket_type))
     # Add bl_rna for _socket_idname fallback
-    socket.bl_rna = types.SimpleNamespace(identifier=socket.bl_idname)
+    socket.bl_rna = _bl_rna_for(socket.bl_idname)
     return socket
 
 
 def _make_describe_mock_node(name, bl_idname, inputs=None, outputs=None, label=""):
     """Create a mock node for describe tests."""
-    node = types.SimpleNamespace(
-        name=name,
-        bl_idname=bl_idname,
-        label=label,
-        inputs=inputs or [],
-        outputs=outputs or [],
-    )
+    node = _MockNode(name, bl_idname, inputs or [], outputs or [], label)
     # Assign node reference to sockets
     for inp in node.inputs:
         inp.node = node
@@ -634,11 +676,7 @@ def test_add_node_with_normalized_input_name(toolkit):
                 outputs=[],
             )
             # Make inputs iterable and dict-like
-            node.inputs = type('InputsDict', (), {
-                '__iter__': lambda self: iter(inputs),
-                '__contains__': lambda self, key: any(i.name == key for i in inputs),
-                '__getitem__': lambda self, key: next((i for i in inputs if i.name == key), None),
-            })()
+            node.inputs = _InputsView(inputs)
             for inp in inputs:
                 inp.node = node
             nodes_list.append(node)
@@ -715,40 +753,13 @@ def _make_linkable_node(name, bl_idname, inputs_spec, outputs_spec):
 
     inputs_spec/outputs_spec: list of (name, type) tuples
     """
-    inputs = []
-    for inp_name, inp_type in inputs_spec:
-        sock = types.SimpleNamespace(
-            name=inp_name,
-            type=inp_type,
-            is_output=False,
-            is_linked=False,
-            bl_idname=f"NodeSocket{inp_type.title().replace('_', '')}",
-        )
-        sock.bl_rna = types.SimpleNamespace(identifier=sock.bl_idname)
-        inputs.append(sock)
-
-    outputs = []
-    for out_name, out_type in outputs_spec:
-        sock = types.SimpleNamespace(
-            name=out_name,
-            type=out_type,
-            is_output=True,
-            is_linked=False,
-            bl_idname=f"NodeSocket{out_type.title().replace('_', '')}",
-        )
-        sock.bl_rna = types.SimpleNamespace(identifier=sock.bl_idname)
-        outputs.append(sock)
-
-    node = types.SimpleNamespace(
-        name=name,
-        bl_idname=bl_idname,
-        inputs=inputs,
-        outputs=outputs,
-    )
-    for inp in inputs:
-        inp.node = node
-    for out in outputs:
-        out.node = node
+    node = _MockNode(name, bl_idname, [], [])
+    for sockets, specs, is_output in ((node.inputs, inputs_spec, False), (node.outputs, outputs_spec, True)):
+        for sock_name, sock_type in specs:
+            sock = _MockSocket(sock_name, sock_type, is_output, False, _mock_socket_idname(sock_type))
+            sock.bl_rna = _bl_rna_for(sock.bl_idname)
+            sock.node = node
+            sockets.append(sock)
 
     return node
 
@@ -758,13 +769,7 @@ def _make_linkable_node_group(nodes):
     created_links = []
 
     def new_link(from_sock, to_sock):
-        link = types.SimpleNamespace(
-            from_socket=from_sock,
-            to_socket=to_sock,
-            from_node=from_sock.node,
-            to_node=to_sock.node,
-            is_valid=True,
-        )
+        link = _MockLink(from_sock.node, from_sock, to_sock.node, to_sock)
         created_links.append(link)
         to_sock.is_linked = True
         from_sock.is_linked = True
@@ -772,7 +777,7 @@ def _make_linkable_node_group(nodes):
 
     return types.SimpleNamespace(
         nodes=nodes,
-        links=types.SimpleNamespace(new=new_link),
+        links=_LinksCollection(new_link),
         _created_links=created_links,
     )
 
@@ -860,7 +865,7 @@ def test_describe_only_flags_first_geometry_input(toolkit):
     # Make socket types include Geometry for detection
     for inp in multi_geo.inputs:
         inp.bl_idname = "NodeSocketGeometry"
-        inp.bl_rna = types.SimpleNamespace(identifier="NodeSocketGeometry")
+        inp.bl_rna = _bl_rna_for("NodeSocketGeometry")
 
     group_output = _make_describe_mock_node(
         "Group Output", "NodeGroupOutput",
@@ -897,3 +902,37 @@ def test_describe_skips_switch_node(toolkit):
 
     # Should NOT flag Switch inputs
     assert not any("Switch" in u for u in state["unlinked_required"])
+
+
+# ============================================================================
+# set_node_inputs tests
+# ============================================================================
+
+def test_set_node_inputs_applies_values_in_one_pass(toolkit):
+    """set_node_inputs should set scalars and vectors by socket name."""
+    set_inputs = toolkit["set_node_inputs"]
+
+    size = _make_mock_socket("Size X", "VALUE")
+    scale = _make_mock_socket("Scale", "VECTOR")
+    scale.default_value = [1.0, 1.0, 1.0]
+    node = types.SimpleNamespace(name="Grid", inputs=[size, scale])
+
+    failures = set_inputs(node, {"Size X": 4.0, "Scale": [0.5, 0.25, 2.0]})
+
+    assert failures == {}
+    assert size.default_value == 4.0
+    assert scale.default_value == [0.5, 0.25, 2.0]
+
+
+def test_set_node_inputs_reports_unknown_inputs(toolkit):
+    """Unknown names should be reported without blocking the other inputs."""
+    set_inputs = toolkit["set_node_inputs"]
+
+    size = _make_mock_socket("Size X", "VALUE")
+    node = types.SimpleNamespace(name="Grid", inputs=[size])
+
+    failures = set_inputs(node, {"Missing": 1.0, "Size X": 2.0})
+
+    assert list(failures) == ["Missing"]
+    assert isinstance(failures["Missing"], KeyError)
+    assert size.default_value == 2.0
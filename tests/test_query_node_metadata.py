@@ -0,0 +1,136 @@
+"""Tests for the node metadata lookup script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "query_node_metadata.py"
+
+NODES = [
+    {"identifier": "GeometryNodeMeshGrid", "label": "Grid"},
+    {"identifier": "GeometryNodeDistributePointsOnFaces", "label": "Distribute Points on Faces"},
+    {"identifier": "GeometryNodeInstanceOnPoints", "label": "Instance on Points"},
+]
+ALIASES = {"GeometryNodeDistributePointsOnFaces": ["Scatter"]}
+
+
+@pytest.fixture(scope="module")
+def query():
+    spec = importlib.util.spec_from_file_location("query_node_metadata", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def indices(query):
+    return query.build_indices(NODES)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("geometrynodemeshgrid", "GeometryNodeMeshGrid"),
+        ("Instance on Points", "GeometryNodeInstanceOnPoints"),
+        ("scatter", "GeometryNodeDistributePointsOnFaces"),
+        ("Distribute Point on Face", "GeometryNodeDistributePointsOnFaces"),
+    ],
+)
+def test_resolve_query(query, indices, text, expected):
+    identifier_index, label_index = indices
+    entry = query.resolve_query(text, identifier_index, label_index, ALIASES)
+    assert entry["identifier"] == expected
+
+
+def test_resolve_query_unknown_returns_none(query, indices):
+    identifier_index, label_index = indices
+    assert query.resolve_query("Volume Cube", identifier_index, label_index, ALIASES) is None
+
+
+def test_fuzzy_choices_cached_per_index(query, indices):
+    identifier_index, label_index = indices
+    choices = query.fuzzy_choices(identifier_index, label_index)
+    assert query.fuzzy_choices(identifier_index, label_index) is choices
+    assert [len(c) for c in choices] == sorted(len(c) for c in choices)
+    assert set(choices) == set(identifier_index) | set(label_index)
+
+    rebuilt = query.fuzzy_choices(*query.build_indices(NODES[:1]))
+    assert set(rebuilt) == {"geometrynodemeshgrid", "grid"}
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Distrib", "GeometryNodeDistributePointsOnFaces"),
+        ("scat", "GeometryNodeDistributePointsOnFaces"),
+        ("GeometryNode", "GeometryNodeMeshGrid"),
+    ],
+)
+def test_resolve_query_prefix_prefers_shortest_name(query, indices, text, expected):
+    identifier_index, label_index = indices
+    entry = query.resolve_query(text, identifier_index, label_index, ALIASES)
+    assert entry["identifier"] == expected
+
+
+def test_identifier_beats_alias_with_same_name(query, indices):
+    identifier_index, label_index = indices
+    aliases = {"GeometryNodeInstanceOnPoints": ["grid"]}
+    entry = query.resolve_query("grid", identifier_index, label_index, aliases)
+    assert entry["identifier"] == "GeometryNodeMeshGrid"
+
+
+def test_alias_file_metadata_keys_are_ignored(query, indices):
+    identifier_index, label_index = indices
+    aliases = {"_comment": "Maps node identifiers to searchable aliases.", **ALIASES}
+    names, _ = query.name_lookup(identifier_index, label_index, aliases)
+    assert "m" not in names
+    assert "_comment" not in names.values()
+    entry = query.resolve_query("Scat", identifier_index, label_index, aliases)
+    assert entry["identifier"] == "GeometryNodeDistributePointsOnFaces"
+
+
+def test_resolve_query_with_reference_alias_file(query):
+    catalogue = query.load_json(query.CATALOGUE)
+    identifier_index, label_index = query.build_indices(catalogue.get("nodes", catalogue))
+    aliases = query.load_json(query.ALIAS_FILE)
+    assert "_comment" in aliases
+    entry = query.resolve_query("m", identifier_index, label_index, aliases)
+    assert entry["identifier"] == "ShaderNodeMix"
+
+
+def test_load_json(query, tmp_path):
+    path = tmp_path / "aliases.json"
+    path.write_text('{"GeometryNodeMeshGrid": ["plane"]}', encoding="utf-8")
+    assert query.load_json(path) == {"GeometryNodeMeshGrid": ["plane"]}
+    assert query.load_json(tmp_path / "missing.json") is None
+
+
+def test_print_metadata(query, capsys):
+    entry = {"identifier": "GeometryNodeMeshGrid", "label": "Grid", "inputs": [{"name": "Size X", "type": "FLOAT"}]}
+    extras = {"GeometryNodeMeshGrid": {"description": "Planar mesh."}}
+    query.print_metadata(entry, extras, {"GeometryNodeMeshGrid": ["scatter"]})
+    assert capsys.readouterr().out == (
+        "Identifier: GeometryNodeMeshGrid\n"
+        "Label     : Grid\n"
+        "Inputs    :\n"
+        "  - Size X (FLOAT)\n"
+        "Outputs   :\n"
+        "Description:\n"
+        "  Planar mesh.\n"
+        "Patterns : scatter\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["Distribute Point on Face", "gird", "instanse on pont", "GeometryNodeMeshGird", "Volume Cube", "points on"],
+)
+def test_rapidfuzz_matches_difflib_fallback(query, indices, monkeypatch, text):
+    pytest.importorskip("rapidfuzz")
+    assert query.process is not None
+    identifier_index, label_index = indices
+    with_rapidfuzz = query.resolve_query(text, identifier_index, label_index, ALIASES)
+    monkeypatch.setattr(query, "process", None)
+    with_difflib = query.resolve_query(text, identifier_index, label_index, ALIASES)
+    assert with_rapidfuzz == with_difflib
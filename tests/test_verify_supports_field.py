@@ -0,0 +1,40 @@
+"""Tests for the supports_field catalogue report script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "verify_supports_field.py"
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    spec = importlib.util.spec_from_file_location("verify_supports_field", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_count_supports_field(verifier):
+    nodes = [
+        {
+            "identifier": "GeometryNodeSetPosition",
+            "inputs": [{"supports_field": True}, {"supports_field": True}, {}],
+            "outputs": [{"supports_field": False}],
+        },
+        {"identifier": "GeometryNodeMeshGrid", "inputs": [{}], "outputs": [{}]},
+        {"inputs": [], "outputs": [{"supports_field": True}]},
+    ]
+    total, supported, by_node = verifier.count_supports_field(nodes)
+    assert (total, supported) == (7, 3)
+    assert by_node == {"GeometryNodeSetPosition": 2, "<unknown>": 1}
+
+
+def test_load_catalogue_accepts_dict_and_list(verifier, tmp_path):
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text('{"nodes": [{"identifier": "A"}]}', encoding="utf-8")
+    bare = tmp_path / "bare.json"
+    bare.write_text('[{"identifier": "B"}]', encoding="utf-8")
+    assert verifier.load_catalogue(wrapped) == [{"identifier": "A"}]
+    assert verifier.load_catalogue(bare) == [{"identifier": "B"}]
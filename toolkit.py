@@ -19,11 +19,13 @@ Compatible with: Blender 4.4+
 """
 
 import bpy
+import bisect
 import os
 import tempfile
 import math
 import json
 import csv
+from collections import deque
 from mathutils import Euler
 
 # ============================================================================
@@ -91,6 +93,7 @@ _SOCKET_COMPAT_SOURCE = None
 _MERMAID_TYPE_MAP = None
 _NODE_ALIASES = None
 _NODE_ALIASES_SOURCE = None
+_NODE_ALIAS_LOOKUP = None
 
 def get_blender_version():
     """Return Blender version tuple and string."""
@@ -279,6 +282,26 @@ def load_node_aliases(path=None, force_reload=False):
     return _NODE_ALIASES
 
 
+def _alias_lookup():
+    """Return ``(exact, folded)`` alias -> identifier maps for the loaded aliases.
+
+    The first identifier listing an alias wins, matching the old linear scan.
+    Rebuilt only when ``load_node_aliases`` hands back a different dict.
+    """
+    global _NODE_ALIAS_LOOKUP
+    aliases = load_node_aliases()
+    cached = _NODE_ALIAS_LOOKUP
+    if cached is None or cached[0] is not aliases:
+        exact = {}
+        folded = {}
+        for identifier, alias_list in aliases.items():
+            for alias in alias_list:
+                exact.setdefault(alias, identifier)
+                folded.setdefault(alias.casefold(), identifier)
+        cached = _NODE_ALIAS_LOOKUP = (aliases, exact, folded)
+    return cached[1], cached[2]
+
+
 def get_node_metadata(node_type):
     """Return high-level metadata (label/category/description) for a node."""
     spec = get_node_spec(node_type)
@@ -615,8 +638,46 @@ def set_node_input(node, input_name, value):
         raise KeyError(f"Input '{input_name}' not found on {node.name}. "
                        f"Available: {available}")
 
-    inp = node.inputs[input_name]
+    _assign_input_value(node.inputs[input_name], value)
+    return True
+
+
+def set_node_inputs(node, values):
+    """
+    Set several input default values on one node by name.
+
+    Walks node.inputs once instead of once per input, then assigns each
+    value the same way as set_node_input().
+
+    Args:
+        node: The node to modify
+        values: Dict mapping input socket names to values
+
+    Returns:
+        Dict mapping input names that could not be set to the exception
+        raised; empty when every value was applied
+    """
+    by_name = {}
+    for inp in node.inputs:
+        by_name.setdefault(inp.name, inp)
+
+    failures = {}
+    for input_name, value in values.items():
+        inp = by_name.get(input_name)
+        if inp is None:
+            available = [name for name in by_name if name]
+            failures[input_name] = KeyError(
+                f"Input '{input_name}' not found on {node.name}. Available: {available}"
+            )
+            continue
+        try:
+            _assign_input_value(inp, value)
+        except Exception as e:
+            failures[input_name] = e
+    return failures
+
 
+def _assign_input_value(inp, value):
     # Handle vector/color types
     if isinstance(value, (list, tuple)):
         if hasattr(inp, 'default_value') and hasattr(inp.default_value, '__len__'):
@@ -627,8 +688,6 @@ def set_node_input(node, input_name, value):
     else:
         inp.default_value = value
 
-    return True
-
 
 # ============================================================================
 # COLLECTION HELPERS - Safe isolation for testing
@@ -711,6 +770,11 @@ SPECIAL_NODE_TYPES = {
     "__GROUP_OUTPUT__": "NodeGroupOutput",
 }
 
+# Shared bl_idname filters: group interface nodes, and nodes that hold no
+# graph content of their own (group IO plus frames).
+_GROUP_IO_IDNAMES = frozenset(SPECIAL_NODE_TYPES.values())
+_NON_CONTENT_IDNAMES = _GROUP_IO_IDNAMES | {"NodeFrame"}
+
 
 def _serialize_value(value):
     if value is None:
@@ -733,7 +797,7 @@ def _node_type_for_id(node_id, node_type=None):
 
 
 def _socket_names_for_node(node_type, is_output=True, node_id=None):
-    if node_type in {"NodeGroupInput", "NodeGroupOutput"} or node_id in SPECIAL_NODE_TYPES:
+    if node_type in _GROUP_IO_IDNAMES or node_id in SPECIAL_NODE_TYPES:
         return None
     spec = get_node_spec(node_type) if node_type else None
     if not spec:
@@ -955,44 +1019,59 @@ def _export_frames(node_group, node_positions=None):
     frames = []
     node_positions = dict(node_positions or {})
 
-    # Ensure we have coordinates for every regular node even if the caller
+    # Single pass over the nodes: collect frames (and their IDs so they can be
+    # excluded from containment checks), group nodes by parent frame, and
+    # ensure we have coordinates for every regular node even if the caller
     # did not request positions in the export payload.
+    frame_nodes = []
+    frame_ids = set()
+    children_by_frame = {}
     for node in node_group.nodes:
-        if node.bl_idname in {"NodeGroupInput", "NodeGroupOutput", "NodeFrame"}:
+        bl_idname = node.bl_idname
+        if bl_idname == "NodeFrame":
+            frame_id = node.get(_FRAME_ID_PROP, node.name)
+            frame_nodes.append((node, frame_id))
+            frame_ids.add(frame_id)
+            continue
+        if bl_idname in _GROUP_IO_IDNAMES:
             continue
         node_id = node.get(_NODE_ID_PROP, node.name)
         node_positions.setdefault(node_id, [node.location.x, node.location.y])
-
-    # Get frame IDs so we can exclude them from containment checks
-    frame_ids = set()
-    for node in node_group.nodes:
-        if node.bl_idname == "NodeFrame":
-            frame_ids.add(node.get(_FRAME_ID_PROP, node.name))
-
-    for node in node_group.nodes:
-        if node.bl_idname != "NodeFrame":
-            continue
-
-        frame_id = node.get(_FRAME_ID_PROP, node.name)
-
-        # Determine which nodes are visually inside this frame
-        # by checking if node positions fall within frame bounds
-        frame_x = node.location.x
-        frame_y = node.location.y
-        frame_w = node.width
-        frame_h = node.height
-
-        contained_nodes = []
-        for nid, pos in node_positions.items():
-            # Skip other frames
-            if nid in frame_ids:
-                continue
-            nx, ny = pos
-            # Check if node center is inside frame bounds
+        parent = getattr(node, "parent", None)
+        if parent is not None and getattr(parent, "bl_idname", "") == "NodeFrame":
+            children_by_frame.setdefault(parent.name, []).append(node_id)
+
+    # Sort node positions by X once (skipping other frames) so each frame
+    # only checks nodes inside its horizontal span instead of every node.
+    # The insertion order is kept so contained nodes are reported in the
+    # same order as node_positions.
+    indexed = sorted(
+        (pos[0], order, nid, pos[1])
+        for order, (nid, pos) in enumerate(node_positions.items())
+        if nid not in frame_ids
+    )
+    indexed_xs = [entry[0] for entry in indexed]
+
+    for node, frame_id in frame_nodes:
+        # Nodes parented to the frame are authoritative; otherwise determine
+        # which nodes are visually inside this frame by checking if node
+        # positions fall within frame bounds
+        contained_nodes = children_by_frame.get(node.name)
+        if not contained_nodes:
+            frame_x = node.location.x
+            frame_y = node.location.y
+            frame_w = node.width
+            frame_h = node.height
+
+            lo = bisect.bisect_left(indexed_xs, frame_x)
+            hi = bisect.bisect_right(indexed_xs, frame_x + frame_w)
             # Frame y is top, extends downward; node y is also top
-            if (frame_x <= nx <= frame_x + frame_w and
-                frame_y - frame_h <= ny <= frame_y):
-                contained_nodes.append(nid)
+            hits = sorted(
+                (order, nid)
+                for _, order, nid, ny in indexed[lo:hi]
+                if frame_y - frame_h <= ny <= frame_y
+            )
+            contained_nodes = [nid for _, nid in hits]
 
         frame_spec = {
             "id": frame_id,
@@ -1002,7 +1081,8 @@ def _export_frames(node_group, node_positions=None):
 
         # Add color if custom color is enabled
         if node.use_custom_color:
-            frame_spec["color"] = [node.color[0], node.color[1], node.color[2], 1.0]
+            color = node.color
+            frame_spec["color"] = [color[0], color[1], color[2], 1.0]
 
         # Add shrink state
         if node.shrink:
@@ -1129,7 +1209,7 @@ def validate_graph_json_preflight(graph_json):
             continue
         resolved_type = _node_type_for_id(node_id, node_type)
         node_types[node_id] = resolved_type
-        if resolved_type not in {"NodeGroupInput", "NodeGroupOutput"} and not get_node_spec(resolved_type):
+        if resolved_type not in _GROUP_IO_IDNAMES and not get_node_spec(resolved_type):
             unknown_types.append((node_id, resolved_type))
 
     _add_check(
@@ -1248,7 +1328,7 @@ def _gather_existing_nodes(node_group):
     """Map node.name to node for existing nodes (excluding group IO)."""
     mapping = {}
     for node in node_group.nodes:
-        if node.bl_idname in {"NodeGroupInput", "NodeGroupOutput"}:
+        if node.bl_idname in _GROUP_IO_IDNAMES:
             continue
         key = node.get(_NODE_ID_PROP, node.name)
         mapping[key] = node
@@ -1259,15 +1339,12 @@ def _gather_existing_links(node_group):
     """Map existing links keyed by from/to node names and socket names."""
     links = {}
     for link in node_group.links:
-        if not link.from_node or not link.to_node:
+        from_node = link.from_node
+        to_node = link.to_node
+        if not from_node or not to_node:
             continue
-        key = _link_key(
-            link.from_node.name,
-            link.from_socket.name,
-            link.to_node.name,
-            link.to_socket.name,
-        )
-        links[key] = link
+        # Same layout as _link_key, built inline to skip a call per link
+        links[(from_node.name, link.from_socket.name, to_node.name, link.to_socket.name)] = link
     return links
 
 
@@ -1293,11 +1370,25 @@ def _calculate_frame_bounds(nodes, padding=_FRAME_PADDING):
     NODE_WIDTH_ESTIMATE = 150
     NODE_HEIGHT_ESTIMATE = 150
 
-    # Get bounds considering estimated node dimensions
-    min_x = min(n.location.x for n in nodes)
-    max_x = max(n.location.x + getattr(n, 'width', NODE_WIDTH_ESTIMATE) for n in nodes)
-    max_y = max(n.location.y for n in nodes)  # top
-    min_y = min(n.location.y - NODE_HEIGHT_ESTIMATE for n in nodes)  # bottom
+    # Get bounds considering estimated node dimensions, reading each node's
+    # location once (bpy attribute access dominates the cost here)
+    min_x = max_x = max_y = min_y = None
+    for n in nodes:
+        loc = n.location
+        x, y = loc.x, loc.y
+        right = x + getattr(n, 'width', NODE_WIDTH_ESTIMATE)
+        if min_x is None:
+            min_x, max_x, max_y, min_y = x, right, y, y
+            continue
+        if x < min_x:
+            min_x = x
+        if right > max_x:
+            max_x = right
+        if y > max_y:
+            max_y = y  # top
+        elif y < min_y:
+            min_y = y
+    min_y -= NODE_HEIGHT_ESTIMATE  # bottom
 
     # Add padding
     x = min_x - padding
@@ -1378,21 +1469,20 @@ def _clear_managed_frames(node_group):
     if not hasattr(node_group, "nodes"):
         return
 
+    # Collect first, remove after, so the collection isn't mutated mid-scan
     frames_to_remove = []
-    for node in list(node_group.nodes):
+    for node in node_group.nodes:
         if getattr(node, "bl_idname", "") != "NodeFrame":
             continue
 
         keys_fn = getattr(node, "keys", None)
-        node_keys = []
-        if callable(keys_fn):
-            try:
-                node_keys = list(keys_fn())
-            except Exception:
-                node_keys = []
-
-        if _FRAME_ID_PROP in node_keys:
-            frames_to_remove.append(node)
+        if not callable(keys_fn):
+            continue
+        try:
+            if _FRAME_ID_PROP in keys_fn():
+                frames_to_remove.append(node)
+        except Exception:
+            continue
 
     for frame in frames_to_remove:
         try:
@@ -1475,7 +1565,7 @@ def auto_frame_graph(node_group, strategy="connectivity", apply=False):
         # Build node_map for frame creation
         node_map = {}
         for node in node_group.nodes:
-            if node.bl_idname in {"NodeGroupInput", "NodeGroupOutput", "NodeFrame"}:
+            if node.bl_idname in _NON_CONTENT_IDNAMES:
                 continue
             node_id = node.get(_NODE_ID_PROP, node.name)
             node_map[node_id] = node
@@ -1500,7 +1590,7 @@ def _auto_frame_by_connectivity(node_group):
     # Get all non-special nodes
     nodes_by_id = {}
     for node in node_group.nodes:
-        if node.bl_idname in {"NodeGroupInput", "NodeGroupOutput", "NodeFrame"}:
+        if node.bl_idname in _NON_CONTENT_IDNAMES:
             continue
         node_id = node.get(_NODE_ID_PROP, node.name)
         nodes_by_id[node_id] = node
@@ -1532,21 +1622,19 @@ def _auto_frame_by_connectivity(node_group):
         if start_id in visited:
             continue
 
-        # BFS from this node
+        # BFS from this node; mark on enqueue so each node is queued once
         component = []
-        queue = [start_id]
+        queue = deque([start_id])
+        visited.add(start_id)
         while queue:
-            node_id = queue.pop(0)
-            if node_id in visited:
-                continue
-            visited.add(node_id)
+            node_id = queue.popleft()
             component.append(node_id)
             for neighbor in adjacency[node_id]:
                 if neighbor not in visited:
+                    visited.add(neighbor)
                     queue.append(neighbor)
 
-        if component:
-            components.append(component)
+        components.append(component)
 
     # Generate frame specs for components with >1 node
     frames = []
@@ -1587,55 +1675,60 @@ def _auto_frame_by_connectivity(node_group):
     return frames
 
 
+# Keyword categories for _auto_frame_by_type, checked in order; the first
+# keyword found in a node's bl_idname wins, anything else lands in "Other".
+_TYPE_FRAME_CATEGORIES = (
+    ("Mesh", (0.2, 0.6, 0.8, 0.8)),
+    ("Curve", (0.8, 0.5, 0.2, 0.8)),
+    ("Instance", (0.2, 0.7, 0.4, 0.8)),
+    ("Math", (0.7, 0.7, 0.2, 0.8)),
+    ("Vector", (0.6, 0.4, 0.8, 0.8)),
+    ("Geometry", (0.3, 0.5, 0.7, 0.8)),
+    ("Attribute", (0.7, 0.3, 0.5, 0.8)),
+    ("Input", (0.4, 0.7, 0.4, 0.8)),
+    ("Other", (0.5, 0.5, 0.5, 0.8)),
+)
+_TYPE_FRAME_CATEGORY_BY_IDNAME = {}
+
+
+def _type_frame_category(bl_idname):
+    """Return the _TYPE_FRAME_CATEGORIES name for a node type (memoized)."""
+    category = _TYPE_FRAME_CATEGORY_BY_IDNAME.get(bl_idname)
+    if category is None:
+        category = next(
+            (name for name, _ in _TYPE_FRAME_CATEGORIES[:-1] if name in bl_idname),
+            "Other",
+        )
+        _TYPE_FRAME_CATEGORY_BY_IDNAME[bl_idname] = category
+    return category
+
+
 def _auto_frame_by_type(node_group):
     """Group nodes by their type prefix (GeometryNode*, FunctionNode*, etc.).
 
     Returns a list of frame specs, one per node type category.
     """
-    # Categorize nodes by type prefix
-    categories = {
-        "Mesh": {"prefix": "Mesh", "color": [0.2, 0.6, 0.8, 0.8], "nodes": []},
-        "Curve": {"prefix": "Curve", "color": [0.8, 0.5, 0.2, 0.8], "nodes": []},
-        "Instance": {"prefix": "Instance", "color": [0.2, 0.7, 0.4, 0.8], "nodes": []},
-        "Math": {"prefix": "Math", "color": [0.7, 0.7, 0.2, 0.8], "nodes": []},
-        "Vector": {"prefix": "Vector", "color": [0.6, 0.4, 0.8, 0.8], "nodes": []},
-        "Geometry": {"prefix": "Geometry", "color": [0.3, 0.5, 0.7, 0.8], "nodes": []},
-        "Attribute": {"prefix": "Attribute", "color": [0.7, 0.3, 0.5, 0.8], "nodes": []},
-        "Input": {"prefix": "Input", "color": [0.4, 0.7, 0.4, 0.8], "nodes": []},
-        "Other": {"prefix": None, "color": [0.5, 0.5, 0.5, 0.8], "nodes": []},
-    }
+    nodes_by_category = {name: [] for name, _ in _TYPE_FRAME_CATEGORIES}
 
     for node in node_group.nodes:
-        if node.bl_idname in {"NodeGroupInput", "NodeGroupOutput", "NodeFrame"}:
+        bl_idname = node.bl_idname
+        if bl_idname in _NON_CONTENT_IDNAMES:
             continue
-
         node_id = node.get(_NODE_ID_PROP, node.name)
-        bl_idname = node.bl_idname
-
-        # Find matching category
-        matched = False
-        for cat_name, cat_data in categories.items():
-            if cat_name == "Other":
-                continue
-            if cat_data["prefix"] and cat_data["prefix"] in bl_idname:
-                cat_data["nodes"].append(node_id)
-                matched = True
-                break
-
-        if not matched:
-            categories["Other"]["nodes"].append(node_id)
+        nodes_by_category[_type_frame_category(bl_idname)].append(node_id)
 
     # Generate frame specs for non-empty categories with >1 node
     frames = []
-    for cat_name, cat_data in categories.items():
-        if len(cat_data["nodes"]) < 2:
+    for cat_name, color in _TYPE_FRAME_CATEGORIES:
+        node_ids = nodes_by_category[cat_name]
+        if len(node_ids) < 2:
             continue
 
         frames.append({
             "id": f"type_{cat_name.lower()}",
             "label": f"{cat_name} Nodes",
-            "nodes": cat_data["nodes"],
-            "color": cat_data["color"],
+            "nodes": node_ids,
+            "color": list(color),
         })
 
     return frames
@@ -1645,8 +1738,11 @@ def _diff_graph(node_group, graph_json):
     nodes_spec = {node["id"]: node for node in graph_json.get("nodes", []) if node.get("id")}
     existing_nodes = _gather_existing_nodes(node_group)
 
-    nodes_to_add = [node_id for node_id in nodes_spec if node_id not in existing_nodes]
-    nodes_to_update = [node_id for node_id in nodes_spec if node_id in existing_nodes]
+    # Partition with one hashed probe per id; lists keep spec order for callers.
+    nodes_to_add = []
+    nodes_to_update = []
+    for node_id in nodes_spec:
+        (nodes_to_update if node_id in existing_nodes else nodes_to_add).append(node_id)
     nodes_to_remove = [node_id for node_id in existing_nodes if node_id not in nodes_spec]
 
     desired_links = {}
@@ -1658,8 +1754,10 @@ def _diff_graph(node_group, graph_json):
 
     existing_links = _gather_existing_links(node_group)
 
-    links_to_add = [key for key in desired_links if key not in existing_links]
-    links_to_keep = [key for key in desired_links if key in existing_links]
+    links_to_add = []
+    links_to_keep = []
+    for key in desired_links:
+        (links_to_keep if key in existing_links else links_to_add).append(key)
     links_to_remove = [key for key in existing_links if key not in desired_links]
 
     return {
@@ -1679,11 +1777,8 @@ def _apply_node_settings(node_map, node_settings, errors):
             errors.append(f"Settings for unknown node: {node_id}")
             continue
 
-        for input_name, value in settings.items():
-            try:
-                set_node_input(node, input_name, value)
-            except Exception as e:
-                errors.append(f"Failed to set {node_id}.{input_name}: {e}")
+        for input_name, e in set_node_inputs(node, settings).items():
+            errors.append(f"Failed to set {node_id}.{input_name}: {e}")
 
 
 def _remove_links(node_group, links_to_remove):
@@ -2549,6 +2644,7 @@ print("    - build_graph_from_json(obj, mod, graph_json)")
 print("    - mermaid_to_blender(obj, mod, mermaid_text)  # One-step!")
 print("    - parse_mermaid_to_graph_json(mermaid_text)")
 print("    - set_node_input(node, input_name, value)")
+print("    - set_node_inputs(node, {input_name: value, ...})")
 print("    - safe_link(node_group, from_socket, to_socket)")
 print("  Export (read-back):")
 print("    - export_modifier_to_json(obj, mod)  # Get current graph state!")
@@ -2902,18 +2998,12 @@ def resolve_node_type(name_or_alias):
         return type_map[no_spaces]
 
     # 3. Try aliases (exact match first)
-    aliases = load_node_aliases()
-    for identifier, alias_list in aliases.items():
-        if name_or_alias in alias_list:
-            return identifier
+    exact_aliases, folded_aliases = _alias_lookup()
+    if name_or_alias in exact_aliases:
+        return exact_aliases[name_or_alias]
 
     # 4. Case-insensitive alias match
-    name_lower = name_or_alias.lower()
-    for identifier, alias_list in aliases.items():
-        if name_lower in [a.lower() for a in alias_list]:
-            return identifier
-
-    return None
+    return folded_aliases.get(name_or_alias.casefold())
 
 
 def _normalize_setting_name(name):
@@ -3307,7 +3397,7 @@ def describe_node_group(node_group, include_defaults=False):
     }
 
     for node in node_group.nodes:
-        if node.bl_idname in ("NodeGroupInput", "NodeGroupOutput"):
+        if node.bl_idname in _GROUP_IO_IDNAMES:
             continue
         if node.bl_idname in _OPTIONAL_GEOMETRY_NODES:
             continue